@@ -51,32 +51,36 @@ Basic usage:
     print(f"Passed: {result.passed}")
 """
 
-from evaldeck.config import EvaldeckConfig
-from evaldeck.evaluator import EvaluationRunner, Evaluator
-from evaldeck.results import (
-    EvaluationResult,
-    GradeResult,
-    GradeStatus,
-    MetricResult,
-    RunResult,
-    SuiteResult,
-)
-from evaldeck.test_case import (
-    EvalCase,
-    EvalSuite,
-    ExpectedBehavior,
-    GraderConfig,
-    Turn,
-)
-from evaldeck.trace import (
-    Message,
-    Step,
-    StepStatus,
-    StepType,
-    TokenUsage,
-    Trace,
-    TraceStatus,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from evaldeck.config import EvaldeckConfig
+    from evaldeck.evaluator import EvaluationRunner, Evaluator
+    from evaldeck.results import (
+        EvaluationResult,
+        GradeResult,
+        GradeStatus,
+        MetricResult,
+        RunResult,
+        SuiteResult,
+    )
+    from evaldeck.test_case import (
+        EvalCase,
+        EvalSuite,
+        ExpectedBehavior,
+        GraderConfig,
+        Turn,
+    )
+    from evaldeck.trace import (
+        Message,
+        Step,
+        StepStatus,
+        StepType,
+        TokenUsage,
+        Trace,
+        TraceStatus,
+    )
 
 __version__ = "0.1.0"
 
@@ -110,3 +114,43 @@ __all__ = [
     # Config
     "EvaldeckConfig",
 ]
+
+# Where each public name lives. Submodules are imported on first attribute
+# access, so `import evaldeck` (and `evaldeck --help`) doesn't pay for
+# pydantic, yaml and the grader stack until they are actually used.
+_EXPORTS = {
+    "Trace": "evaldeck.trace",
+    "Step": "evaldeck.trace",
+    "StepType": "evaldeck.trace",
+    "StepStatus": "evaldeck.trace",
+    "TraceStatus": "evaldeck.trace",
+    "TokenUsage": "evaldeck.trace",
+    "Message": "evaldeck.trace",
+    "EvalCase": "evaldeck.test_case",
+    "EvalSuite": "evaldeck.test_case",
+    "ExpectedBehavior": "evaldeck.test_case",
+    "GraderConfig": "evaldeck.test_case",
+    "Turn": "evaldeck.test_case",
+    "GradeResult": "evaldeck.results",
+    "GradeStatus": "evaldeck.results",
+    "MetricResult": "evaldeck.results",
+    "EvaluationResult": "evaldeck.results",
+    "SuiteResult": "evaldeck.results",
+    "RunResult": "evaldeck.results",
+    "Evaluator": "evaldeck.evaluator",
+    "EvaluationRunner": "evaldeck.evaluator",
+    "EvaldeckConfig": "evaldeck.config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
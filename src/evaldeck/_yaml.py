@@ -0,0 +1,9 @@
+"""YAML loader and dumper shared by config and test case files."""
+
+from __future__ import annotations
+
+import yaml
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
@@ -5,29 +5,38 @@ from __future__ import annotations
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich import box
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.panel import Panel
-from rich.table import Table
 
-from evaldeck.config import EvaldeckConfig, generate_default_config, generate_example_test
-from evaldeck.results import EvaluationResult, GradeStatus, RunResult
+# Everything else (pydantic models, yaml, rich widgets) is imported inside the
+# commands that need it, so `evaldeck --help` and `evaldeck init` start fast.
+if TYPE_CHECKING:
+    from evaldeck.results import EvaluationResult, RunResult
 
-console = Console()
+# Auto-highlighting (numbers, paths) is invisible when output is piped to a file
+# or CI log, so skip its regex pass there. Markup is kept: it strips [tags].
+console = Console(highlight=sys.stdout.isatty())
 logger = logging.getLogger("evaldeck")
 
 
 def setup_logging(verbose: bool) -> None:
-    """Configure logging with rich handler."""
+    """Configure logging with rich handler.
+
+    Safe to call more than once (e.g. when commands are invoked in-process by
+    tests): later calls only update the level.
+    """
+    from rich.logging import RichHandler
+
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    if any(isinstance(h, RichHandler) for h in logger.handlers):
+        return
+
     # Only configure evaldeck logger, not root (to avoid noise from other libraries)
     handler = RichHandler(console=console, show_time=False, show_path=False)
     handler.setFormatter(logging.Formatter("%(message)s"))
-
     logger.addHandler(handler)
-    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
 
     # Suppress noisy loggers
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -47,6 +56,10 @@ def main() -> None:
 @click.option("--force", "-f", is_flag=True, help="Overwrite existing files")
 def init(force: bool) -> None:
     """Initialize a new evaldeck project."""
+    from rich.panel import Panel
+
+    from evaldeck.config import generate_default_config, generate_example_test
+
     config_path = Path("evaldeck.yaml")
     test_dir = Path("tests/evals")
     example_test = test_dir / "example.yaml"
@@ -112,6 +125,9 @@ def run(
     workers: int | None,
 ) -> None:
     """Run evaluations."""
+    from evaldeck.config import EvaldeckConfig
+    from evaldeck.results import GradeStatus
+
     setup_logging(verbose)
 
     try:
@@ -142,7 +158,8 @@ def run(
 
     # Filter suites if specified
     if suite:
-        suites = [s for s in suites if s.name in suite]
+        wanted = frozenset(suite)
+        suites = [s for s in suites if s.name in wanted]
 
     # Count total tests
     total_tests = sum(len(s.test_cases) for s in suites)
@@ -218,6 +235,8 @@ def run(
         if verbose:
             logger.exception("Full traceback:")
         sys.exit(1)
+    finally:
+        runner.close()
 
     # Print summary
     console.print()
@@ -241,6 +260,10 @@ def run(
 
 def _print_summary(result: RunResult) -> None:
     """Print evaluation summary."""
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
     table = Table(box=box.SIMPLE)
     table.add_column("Metric", style="bold")
     table.add_column("Value", justify="right")
@@ -256,10 +279,9 @@ def _print_summary(result: RunResult) -> None:
 def _write_output(result: RunResult, format: str, path: str) -> None:
     """Write results to file."""
     if format == "json":
-        import json
-
-        with open(path, "w") as f:
-            json.dump(result.model_dump(mode="json"), f, indent=2, default=str)
+        # Serialize in pydantic-core rather than via an intermediate dict + json.dump
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(result.model_dump_json(indent=2))
     elif format == "junit":
         _write_junit(result, path)
 
@@ -267,37 +289,45 @@ def _write_output(result: RunResult, format: str, path: str) -> None:
 
 
 def _write_junit(result: RunResult, path: str) -> None:
-    """Write results in JUnit XML format."""
-    import xml.etree.ElementTree as ET
+    """Write results in JUnit XML format.
 
-    testsuites = ET.Element("testsuites")
-    testsuites.set("tests", str(result.total))
-    testsuites.set("failures", str(result.failed))
+    Elements are written as they are produced instead of building a DOM,
+    so memory stays flat for large runs.
+    """
+    from xml.sax.saxutils import quoteattr
 
-    for suite_result in result.suites:
-        testsuite = ET.SubElement(testsuites, "testsuite")
-        testsuite.set("name", suite_result.suite_name)
-        testsuite.set("tests", str(suite_result.total))
-        testsuite.set("failures", str(suite_result.failed))
-        testsuite.set("errors", str(suite_result.errors))
+    from evaldeck.results import GradeStatus
 
-        for eval_result in suite_result.results:
-            testcase = ET.SubElement(testsuite, "testcase")
-            testcase.set("name", eval_result.test_case_name)
-            testcase.set("time", str((eval_result.duration_ms or 0) / 1000))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        f.write(f'<testsuites tests="{result.total}" failures="{result.failed}">\n')
 
-            if eval_result.status == GradeStatus.FAIL:
-                failure = ET.SubElement(testcase, "failure")
-                messages = [g.message for g in eval_result.failed_grades if g.message]
-                failure.set("message", "; ".join(messages) or "Test failed")
+        for suite_result in result.suites:
+            f.write(
+                f"  <testsuite name={quoteattr(suite_result.suite_name)}"
+                f' tests="{suite_result.total}" failures="{suite_result.failed}"'
+                f' errors="{suite_result.errors}">\n'
+            )
+
+            for eval_result in suite_result.results:
+                f.write(
+                    f"    <testcase name={quoteattr(eval_result.test_case_name)}"
+                    f' time="{(eval_result.duration_ms or 0) / 1000}"'
+                )
+
+                if eval_result.status == GradeStatus.FAIL:
+                    messages = [g.message for g in eval_result.failed_grades if g.message]
+                    message = "; ".join(messages) or "Test failed"
+                    f.write(f">\n      <failure message={quoteattr(message)} />\n    </testcase>\n")
+                elif eval_result.status == GradeStatus.ERROR:
+                    message = eval_result.error or "Unknown error"
+                    f.write(f">\n      <error message={quoteattr(message)} />\n    </testcase>\n")
+                else:
+                    f.write(" />\n")
 
-            elif eval_result.status == GradeStatus.ERROR:
-                error = ET.SubElement(testcase, "error")
-                error.set("message", eval_result.error or "Unknown error")
+            f.write("  </testsuite>\n")
 
-    tree = ET.ElementTree(testsuites)
-    ET.indent(tree, space="  ")
-    tree.write(path, encoding="unicode", xml_declaration=True)
+        f.write("</testsuites>\n")
 
 
 @main.command()
@@ -330,6 +360,8 @@ def create(
 @main.command()
 def validate() -> None:
     """Validate configuration and test cases."""
+    from evaldeck.config import EvaldeckConfig
+
     try:
         cfg = EvaldeckConfig.load()
         console.print("[green]✓[/green] Config file is valid")
@@ -340,13 +372,11 @@ def validate() -> None:
         console.print(f"[red]✗[/red] Config error: {e}")
         sys.exit(1)
 
-    # Validate test cases
-    from evaldeck.evaluator import EvaluationRunner
-
-    runner = EvaluationRunner(config=cfg)
+    # Validate test cases (no runner needed: skips evaluator imports and LLM cache setup)
+    from evaldeck.test_case import discover_suites
 
     try:
-        suites = runner._discover_suites()
+        suites = discover_suites(cfg)
         total_tests = sum(len(s.test_cases) for s in suites)
         console.print(f"[green]✓[/green] Found {total_tests} valid test case(s)")
     except Exception as e:
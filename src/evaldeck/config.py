@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field
 
+from evaldeck._yaml import SafeDumper, SafeLoader
+
 
 class AgentConfig(BaseModel):
     """Configuration for the agent to test."""
@@ -23,7 +26,14 @@ class GraderDefaults(BaseModel):
 
     llm_model: str = "gpt-4o-mini"
     llm_provider: str | None = None
+    llm_cache: str | None = None  # "memory" or "sqlite"; None disables caching
+    llm_cache_path: str | None = None  # SQLite file, defaults to <output_dir>/llm_cache.db
     timeout: float = 30.0
+    concurrency: int = Field(
+        default=0,
+        ge=0,
+        description="Max I/O-bound grader calls in flight across a run. 0 = unlimited.",
+    )
 
 
 class ThresholdConfig(BaseModel):
@@ -95,59 +105,64 @@ class EvaldeckConfig(BaseModel):
             path = Path(path)
             if not path.exists():
                 raise FileNotFoundError(f"Config file not found: {path}")
-            return cls._load_file(path)
+            return cls._load_cached(path)
 
         # Search for config file
         for name in ["evaldeck.yaml", "evaldeck.yml"]:
             p = Path(name)
             if p.exists():
-                return cls._load_file(p)
+                return cls._load_cached(p)
 
         # Return default config
         return cls()
 
+    @classmethod
+    def _load_cached(cls, path: Path) -> EvaldeckConfig:
+        """Load a config file, reusing the parsed result while the file is unchanged.
+
+        Returns a copy, so callers may modify the config freely.
+        """
+        stat = path.stat()
+        config = _load_file_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        return config.model_copy(deep=True)
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Forget all parsed config files."""
+        _load_file_cached.cache_clear()
+
     @classmethod
     def _load_file(cls, path: Path) -> EvaldeckConfig:
         """Load configuration from a specific file."""
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
-
-        # Handle nested objects
-        if "agent" in data and isinstance(data["agent"], dict):
-            data["agent"] = AgentConfig(**data["agent"])
-
-        if "graders" in data and isinstance(data["graders"], dict):
-            # Handle 'llm' sub-key
-            if "llm" in data["graders"]:
-                llm_config = data["graders"]["llm"]
-                data["graders"] = GraderDefaults(
-                    llm_model=llm_config.get("model", "gpt-4o-mini"),
-                    llm_provider=llm_config.get("provider"),
-                )
-            else:
-                data["graders"] = GraderDefaults(**data["graders"])
-
-        if "thresholds" in data and isinstance(data["thresholds"], dict):
-            data["thresholds"] = ThresholdConfig(**data["thresholds"])
-
-        if "execution" in data and isinstance(data["execution"], dict):
-            data["execution"] = ExecutionConfig(**data["execution"])
-
-        if "suites" in data:
-            suites = []
-            for s in data["suites"]:
-                if isinstance(s, dict):
-                    suites.append(SuiteConfig(**s))
-                else:
-                    suites.append(s)
-            data["suites"] = suites
-
-        return cls(**data)
+        # Hand libyaml the raw bytes: one read, decoded in C
+        data = yaml.load(path.read_bytes(), Loader=SafeLoader) or {}
+
+        # Flatten the graders.llm sub-key into GraderDefaults' llm_* fields;
+        # everything else is validated by pydantic in a single pass
+        graders = data.get("graders")
+        if isinstance(graders, dict) and isinstance(graders.get("llm"), dict):
+            llm_config = graders.pop("llm")
+            for key in ("model", "provider", "cache", "cache_path"):
+                if key in llm_config:
+                    graders[f"llm_{key}"] = llm_config[key]
+
+        return cls.model_validate(data)
 
     def save(self, path: str | Path) -> None:
         """Save configuration to file."""
         with open(path, "w") as f:
-            yaml.dump(self.model_dump(exclude_none=True), f, default_flow_style=False)
+            yaml.dump(
+                self.model_dump(exclude_none=True),
+                f,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+            )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_file_cached(path: str, mtime_ns: int, size: int) -> EvaldeckConfig:
+    """Parse a config file. Keyed on mtime and size so edits invalidate the entry."""
+    return EvaldeckConfig._load_file(Path(path))
 
 
 def generate_default_config() -> str:
@@ -181,6 +196,7 @@ graders:
   llm:
     model: gpt-4o-mini
     # API key from OPENAI_API_KEY environment variable
+    # cache: sqlite   # Reuse responses for identical prompts (memory or sqlite)
 
 # Pass/fail thresholds
 thresholds:
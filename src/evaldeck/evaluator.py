@@ -3,24 +3,31 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator, Awaitable, Callable
-from contextlib import asynccontextmanager
+import contextlib
+import contextvars
+import functools
+import inspect
+import logging
+import random
+import sys
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from evaldeck.graders import (
-    BaseGrader,
+from evaldeck.graders.base import BaseGrader
+from evaldeck.graders.code import (
     ContainsGrader,
-    LLMGrader,
     MaxLLMCallsGrader,
     MaxStepsGrader,
     MaxToolCallsGrader,
+    NotContainsGrader,
     TaskCompletedGrader,
     ToolCalledGrader,
     ToolNotCalledGrader,
     ToolOrderGrader,
 )
-from evaldeck.graders.code import NotContainsGrader
 from evaldeck.metrics import (
     BaseMetric,
     DurationMetric,
@@ -37,14 +44,191 @@ from evaldeck.results import (
     SuiteResult,
     TurnResult,
 )
+from evaldeck.test_case import EvalCase, GraderConfig
 from evaldeck.trace import Message
 
 if TYPE_CHECKING:
     from evaldeck.config import EvaldeckConfig
-    from evaldeck.test_case import EvalCase, EvalSuite, ExpectedBehavior, GraderConfig, Turn
+    from evaldeck.graders.cache import LLMCache
+    from evaldeck.test_case import EvalSuite, ExpectedBehavior, Turn
     from evaldeck.trace import Trace
 
 
+# Graders for ExpectedBehavior fields, in the order of Evaluator._expected_graders keys
+_EXPECTED_GRADER_TYPES: tuple[type[BaseGrader], ...] = (
+    ContainsGrader,
+    NotContainsGrader,
+    ToolCalledGrader,
+    ToolNotCalledGrader,
+    ToolOrderGrader,
+    MaxStepsGrader,
+    MaxToolCallsGrader,
+    MaxLLMCallsGrader,
+    TaskCompletedGrader,
+)
+
+
+def _llm_grader(config: GraderConfig, llm_cache: LLMCache | None) -> BaseGrader:
+    """Build an LLMGrader from a grader config."""
+    from evaldeck.graders.llm import LLMGrader
+
+    return LLMGrader(
+        prompt=config.prompt,
+        model=config.model or "gpt-4o-mini",
+        threshold=config.threshold,
+        cache=llm_cache,
+        skip_if_failed=config.skip_if_failed,
+        max_tokens=config.params.get("max_tokens"),
+    )
+
+
+# Grader factories for GraderConfig.type, keyed by lowercased type name
+_GRADER_FACTORIES: dict[str, Callable[[GraderConfig, LLMCache | None], BaseGrader]] = {
+    "llm": _llm_grader,
+    "contains": lambda config, _: ContainsGrader(**config.params),
+    "tool_called": lambda config, _: ToolCalledGrader(**config.params),
+}
+
+logger = logging.getLogger(__name__)
+
+# Backoff between agent retries: 0.5s, 1s, 2s, ... capped at 30s, with jitter
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+_T = TypeVar("_T")
+
+
+async def _close_llm_clients() -> None:
+    """Close async LLM clients opened on the running loop by LLM graders."""
+    # Only imported if some grader already loaded it; otherwise no clients exist
+    llm = sys.modules.get("evaldeck.graders.llm")
+    if llm is not None:
+        await llm.aclose_async_clients()
+
+
+async def _run_and_close_clients(main: Coroutine[Any, Any, _T]) -> _T:
+    """Await main, then close the LLM clients it opened on this loop."""
+    try:
+        return await main
+    finally:
+        await _close_llm_clients()
+
+
+def _run(main: Coroutine[Any, Any, _T]) -> _T:
+    """asyncio.run(), on uvloop's faster event loop when it is installed.
+
+    LLM clients opened during the run are closed before the loop is.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(_run_and_close_clients(main))
+    result: _T = uvloop.run(_run_and_close_clients(main))
+    return result
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """uvloop's event loop factory when it is installed, else None (asyncio's default)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff delay before retry number attempt + 1."""
+    delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2.0**attempt)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds elapsed since a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
+def _is_async_callable(func: Callable[..., Any]) -> bool:
+    """Whether calling func returns a coroutine, including async __call__ objects."""
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(type(func).__call__)
+
+
+async def _to_thread(executor: Executor | None, func: Callable[..., Any], *args: Any) -> Any:
+    """Like asyncio.to_thread, but on the given executor when there is one."""
+    if executor is None:
+        return await asyncio.to_thread(func, *args)
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, func, *args))
+
+
+def _split_deferred(graders: list[BaseGrader]) -> tuple[list[BaseGrader], list[BaseGrader]]:
+    """Split graders into those that run right away and those with prerequisites."""
+    immediate = [g for g in graders if not g.skip_if_failed]
+    deferred = [g for g in graders if g.skip_if_failed]
+    return immediate, deferred
+
+
+def _skip_result(grader: BaseGrader, grades: list[GradeResult]) -> GradeResult | None:
+    """Return a skip result if any of the grader's prerequisites did not pass."""
+    if not grader.skip_if_failed:
+        return None
+    failed = {g.grader_name for g in grades if g.status in (GradeStatus.FAIL, GradeStatus.ERROR)}
+    blocking = sorted(failed.intersection(grader.skip_if_failed))
+    if not blocking:
+        return None
+    return GradeResult.skipped_result(grader.name, f"Skipped: {', '.join(blocking)} failed")
+
+
+def _skipped_turns(turns: list[Turn], start: int) -> list[TurnResult]:
+    """Skipped results for the turns after a fail-fast stop."""
+    return [
+        TurnResult(turn_index=i, user_input=turn.user, status=GradeStatus.SKIP, skipped=True)
+        for i, turn in enumerate(turns[start:], start)
+    ]
+
+
+async def _run_graders(
+    graders: list[BaseGrader],
+    run_grader: Callable[[BaseGrader], Awaitable[GradeResult]],
+    grade_inline: Callable[[BaseGrader], GradeResult],
+) -> list[GradeResult]:
+    """Grade CPU-bound graders inline, then I/O-bound graders concurrently.
+
+    Results are returned in the order of graders.
+    """
+    inline = {g: grade_inline(g) for g in graders if not g.is_io_bound}
+    if len(inline) == len(graders):
+        return list(inline.values())
+    ran = iter(await asyncio.gather(*[run_grader(g) for g in graders if g not in inline]))
+    return [inline[g] if g in inline else next(ran) for g in graders]
+
+
+async def _gather_graders(
+    graders: list[BaseGrader],
+    run_grader: Callable[[BaseGrader], Awaitable[GradeResult]],
+    grade_inline: Callable[[BaseGrader], GradeResult],
+) -> list[GradeResult]:
+    """Run graders concurrently, then run graders with prerequisites.
+
+    Graders without skip_if_failed run first. The remaining graders run
+    concurrently afterwards, unless one of their prerequisites failed.
+    Graders with is_io_bound = False are called inline rather than on a
+    worker thread.
+    """
+    immediate, deferred = _split_deferred(graders)
+    results = await _run_graders(immediate, run_grader, grade_inline)
+    if not deferred:
+        return results
+
+    skipped = {g: _skip_result(g, results) for g in deferred}
+    to_run = [g for g in deferred if skipped[g] is None]
+    ran = iter(await _run_graders(to_run, run_grader, grade_inline))
+    for grader in deferred:
+        results.append(skipped[grader] or next(ran))
+    return results
+
+
 class Evaluator:
     """Main evaluation engine.
 
@@ -84,6 +268,8 @@ class Evaluator:
         graders: list[BaseGrader] | None = None,
         metrics: list[BaseMetric] | None = None,
         config: EvaldeckConfig | None = None,
+        llm_cache: LLMCache | None = None,
+        grader_concurrency: int | None = None,
     ) -> None:
         """Initialize the evaluator.
 
@@ -91,10 +277,41 @@ class Evaluator:
             graders: List of graders to use. If None, uses defaults based on test case.
             metrics: List of metrics to calculate. If None, uses defaults.
             config: Evaldeck configuration.
+            llm_cache: Response cache for LLM graders built from test cases.
+                If None, uses the cache configured under graders.llm.cache (if any).
+            grader_concurrency: Max I/O-bound grader calls (e.g. LLM requests) in
+                flight at once, across all test cases. 0 = unlimited. If None,
+                uses graders.concurrency from config.
         """
         self.graders = graders
         self.metrics = metrics or self._default_metrics()
         self.config = config
+        self.llm_cache = llm_cache or self._default_llm_cache()
+        if grader_concurrency is None:
+            grader_concurrency = config.graders.concurrency if config else 0
+        self.grader_concurrency = grader_concurrency
+        self._expected_graders_cache: dict[tuple[bool, ...], list[BaseGrader]] = {}
+
+    def _new_grader_slots(self) -> asyncio.Semaphore | None:
+        """A semaphore with grader_concurrency slots, or None if unlimited.
+
+        Created per run rather than kept on the evaluator, since a semaphore
+        is bound to the event loop it is first used on.
+        """
+        if self.grader_concurrency <= 0:
+            return None
+        return asyncio.Semaphore(self.grader_concurrency)
+
+    def _default_llm_cache(self) -> LLMCache | None:
+        """Create the LLM response cache from configuration."""
+        if self.config is None or not self.config.graders.llm_cache:
+            return None
+        from pathlib import Path
+
+        from evaldeck.graders.cache import create_llm_cache
+
+        path = self.config.graders.llm_cache_path or Path(self.config.output_dir) / "llm_cache.db"
+        return create_llm_cache(self.config.graders.llm_cache, path)
 
     def _default_metrics(self) -> list[BaseMetric]:
         """Get default metrics."""
@@ -109,36 +326,8 @@ class Evaluator:
         self, expected: ExpectedBehavior | None, grader_configs: list[GraderConfig]
     ) -> list[BaseGrader]:
         """Build graders for a single turn from expected behavior and grader configs."""
-        graders: list[BaseGrader] = []
-
-        if expected:
-            # Add graders based on expected behavior
-            if expected.output_contains:
-                graders.append(ContainsGrader())
-
-            if expected.output_not_contains:
-                graders.append(NotContainsGrader())
-
-            if expected.tools_called:
-                graders.append(ToolCalledGrader())
-
-            if expected.tools_not_called:
-                graders.append(ToolNotCalledGrader())
-
-            if expected.tool_call_order:
-                graders.append(ToolOrderGrader())
-
-            if expected.max_steps is not None:
-                graders.append(MaxStepsGrader())
-
-            if expected.max_tool_calls is not None:
-                graders.append(MaxToolCallsGrader())
-
-            if expected.max_llm_calls is not None:
-                graders.append(MaxLLMCallsGrader())
-
-            if expected.task_completed is not None:
-                graders.append(TaskCompletedGrader())
+        # Add graders based on expected behavior
+        graders = self._expected_graders(expected) if expected else []
 
         # Add graders from config
         for grader_config in grader_configs:
@@ -148,6 +337,33 @@ class Evaluator:
 
         return graders
 
+    def _expected_graders(self, expected: ExpectedBehavior) -> list[BaseGrader]:
+        """Graders for the expected-behavior fields that are set.
+
+        These graders read their values from the test case when grading, so
+        the instances are shared by every turn that sets the same fields.
+        """
+        key = (
+            bool(expected.output_contains),
+            bool(expected.output_not_contains),
+            bool(expected.tools_called),
+            bool(expected.tools_not_called),
+            bool(expected.tool_call_order),
+            expected.max_steps is not None,
+            expected.max_tool_calls is not None,
+            expected.max_llm_calls is not None,
+            expected.task_completed is not None,
+        )
+        graders = self._expected_graders_cache.get(key)
+        if graders is None:
+            graders = [
+                grader_type()
+                for grader_type, wanted in zip(_EXPECTED_GRADER_TYPES, key, strict=True)
+                if wanted
+            ]
+            self._expected_graders_cache[key] = graders
+        return list(graders)
+
     def _build_graders(self, test_case: EvalCase) -> list[BaseGrader]:
         """Build graders from test case (for single-turn backward compat)."""
         # For multi-turn, use first turn's expected behavior
@@ -160,24 +376,10 @@ class Evaluator:
 
     def _create_grader_from_config(self, config: Any) -> BaseGrader | None:
         """Create a grader from configuration."""
-        from evaldeck.test_case import GraderConfig
-
-        if isinstance(config, GraderConfig):
-            grader_type = config.type.lower()
-
-            if grader_type == "llm":
-                return LLMGrader(
-                    prompt=config.prompt,
-                    model=config.model or "gpt-4o-mini",
-                    threshold=config.threshold,
-                )
-            elif grader_type == "contains":
-                return ContainsGrader(**config.params)
-            elif grader_type == "tool_called":
-                return ToolCalledGrader(**config.params)
-            # Add more grader types as needed
-
-        return None
+        if not isinstance(config, GraderConfig):
+            return None
+        factory = _GRADER_FACTORIES.get(config.type.lower())
+        return factory(config, self.llm_cache) if factory else None
 
     def evaluate(
         self,
@@ -202,6 +404,7 @@ class Evaluator:
             EvaluationResult with grades and metrics.
         """
         started_at = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         # Build graders
         graders = self.graders if self.graders else self._build_graders(test_case)
@@ -214,8 +417,13 @@ class Evaluator:
             trace_id=trace.id,
         )
 
-        # Run graders sequentially
-        for grader in graders:
+        # Run graders sequentially, holding back those with prerequisites
+        immediate, deferred = _split_deferred(graders)
+        for grader in immediate + deferred:
+            skipped = _skip_result(grader, result.grades)
+            if skipped:
+                result.add_grade(skipped)
+                continue
             try:
                 grade = grader.grade(trace, test_case)
                 result.add_grade(grade)
@@ -227,12 +435,13 @@ class Evaluator:
             try:
                 metric_result = metric.calculate(trace, test_case)
                 result.add_metric(metric_result)
-            except Exception:
-                pass  # Metrics are optional, don't fail on error
+            except Exception as e:
+                # Metrics are optional, don't fail on error
+                logger.debug("Metric %s failed: %s", metric.name, e)
 
         # Finalize
         result.completed_at = datetime.now()
-        result.duration_ms = (result.completed_at - started_at).total_seconds() * 1000
+        result.duration_ms = _elapsed_ms(start_ns)
 
         return result
 
@@ -253,8 +462,9 @@ class Evaluator:
         Performance benefit: With 3 LLMGraders each taking 2 seconds,
         sync evaluate() takes ~6 seconds while evaluate_async() takes ~2 seconds.
 
-        Code-based graders (ContainsGrader, etc.) automatically run in a
-        thread pool via asyncio.to_thread() to avoid blocking the event loop.
+        Code-based graders (ContainsGrader, etc.) are cheap and run inline.
+        Other sync graders run in a thread pool via asyncio.to_thread() to
+        avoid blocking the event loop.
 
         Args:
             trace: The execution trace to evaluate.
@@ -264,6 +474,7 @@ class Evaluator:
             EvaluationResult with grades and metrics.
         """
         started_at = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         # Build graders
         graders = self.graders if self.graders else self._build_graders(test_case)
@@ -277,13 +488,22 @@ class Evaluator:
         )
 
         # Run graders concurrently
+        grader_slots = self._new_grader_slots()
+
         async def run_grader(grader: BaseGrader) -> GradeResult:
             try:
-                return await grader.grade_async(trace, test_case)
+                async with grader_slots or contextlib.nullcontext():
+                    return await grader.grade_async(trace, test_case)
+            except Exception as e:
+                return GradeResult.error_result(grader.name, f"Grader error: {e}")
+
+        def grade_inline(grader: BaseGrader) -> GradeResult:
+            try:
+                return grader.grade(trace, test_case)
             except Exception as e:
                 return GradeResult.error_result(grader.name, f"Grader error: {e}")
 
-        grade_results = await asyncio.gather(*[run_grader(g) for g in graders])
+        grade_results = await _gather_graders(graders, run_grader, grade_inline)
 
         for grade in grade_results:
             result.add_grade(grade)
@@ -292,10 +512,25 @@ class Evaluator:
         async def run_metric(metric: BaseMetric) -> MetricResult | None:
             try:
                 return await metric.calculate_async(trace, test_case)
-            except Exception:
-                return None  # Metrics are optional, don't fail on error
+            except Exception as e:
+                # Metrics are optional, don't fail on error
+                logger.debug("Metric %s failed: %s", metric.name, e)
+                return None
 
-        metric_results = await asyncio.gather(*[run_metric(m) for m in self.metrics])
+        def calculate_inline(metric: BaseMetric) -> MetricResult | None:
+            try:
+                return metric.calculate(trace, test_case)
+            except Exception as e:
+                logger.debug("Metric %s failed: %s", metric.name, e)
+                return None
+
+        # Cheap metrics (all the defaults) run inline; only the rest are gathered
+        inline = {m: calculate_inline(m) for m in self.metrics if not m.is_io_bound}
+        io_bound = [m for m in self.metrics if m.is_io_bound]
+        gathered = iter(
+            await asyncio.gather(*[run_metric(m) for m in io_bound]) if io_bound else ()
+        )
+        metric_results = [inline[m] if m in inline else next(gathered) for m in self.metrics]
 
         for metric_result in metric_results:
             if metric_result is not None:
@@ -303,7 +538,7 @@ class Evaluator:
 
         # Finalize
         result.completed_at = datetime.now()
-        result.duration_ms = (result.completed_at - started_at).total_seconds() * 1000
+        result.duration_ms = _elapsed_ms(start_ns)
 
         return result
 
@@ -311,7 +546,7 @@ class Evaluator:
         self,
         suite: EvalSuite,
         agent_func: Callable[[str], Trace] | Callable[[str], Awaitable[Trace]],
-        on_result: Callable[[EvaluationResult], None] | None = None,
+        on_result: Callable[[EvaluationResult], Awaitable[None] | None] | None = None,
         max_concurrent: int = 0,
     ) -> SuiteResult:
         """Evaluate all test cases in a suite (sync wrapper).
@@ -320,20 +555,23 @@ class Evaluator:
             suite: The test suite to evaluate.
             agent_func: Function that takes input string and returns a Trace.
                 Can be sync or async.
-            on_result: Optional callback called after each test case.
+            on_result: Optional callback called after each test case. May be async.
             max_concurrent: Maximum concurrent tests. 0 = unlimited.
 
         Returns:
             SuiteResult with all evaluation results.
         """
-        return asyncio.run(self.evaluate_suite_async(suite, agent_func, on_result, max_concurrent))
+        return _run(self.evaluate_suite_async(suite, agent_func, on_result, max_concurrent))
 
     async def evaluate_suite_async(
         self,
         suite: EvalSuite,
         agent_func: Callable[[str], Trace] | Callable[[str], Awaitable[Trace]],
-        on_result: Callable[[EvaluationResult], None] | None = None,
+        on_result: Callable[[EvaluationResult], Awaitable[None] | None] | None = None,
         max_concurrent: int = 0,
+        is_async: bool | None = None,
+        limiter: asyncio.Semaphore | None = None,
+        grader_slots: asyncio.Semaphore | None = None,
     ) -> SuiteResult:
         """Evaluate all test cases in a suite concurrently.
 
@@ -341,8 +579,15 @@ class Evaluator:
             suite: The test suite to evaluate.
             agent_func: Function that takes input string and returns a Trace.
                 Can be sync or async.
-            on_result: Optional callback called after each test case.
+            on_result: Optional callback called after each test case. Async
+                callbacks are awaited, so they can do I/O without blocking
+                other test cases.
             max_concurrent: Maximum concurrent tests. 0 = unlimited.
+            is_async: Whether agent_func is async. Detected when None.
+            limiter: Semaphore held while each test case is evaluated. Lets
+                suites running side by side share one concurrency limit.
+            grader_slots: Semaphore held by each I/O-bound grader call. Created
+                from grader_concurrency when None.
 
         Returns:
             SuiteResult with all evaluation results.
@@ -352,54 +597,60 @@ class Evaluator:
             started_at=datetime.now(),
         )
 
-        # Detect if agent is async
-        is_async = asyncio.iscoroutinefunction(agent_func)
-
-        # Create semaphore if limiting concurrency
-        semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent > 0 else None
-
-        @asynccontextmanager
-        async def maybe_semaphore() -> AsyncIterator[None]:
-            """Context manager that optionally acquires semaphore."""
-            if semaphore:
-                async with semaphore:
-                    yield
-            else:
-                yield
-
-        async def run_test(index: int, test_case: EvalCase) -> tuple[int, EvaluationResult]:
-            """Run a single test case."""
-            async with maybe_semaphore():
-                result = await self._evaluate_single_async(test_case, agent_func, is_async)
-                if on_result:
-                    on_result(result)
-                return index, result
-
-        # Run all tests concurrently
-        tasks = [run_test(i, tc) for i, tc in enumerate(suite.test_cases)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Add results in original order
-        results_by_index: dict[int, EvaluationResult] = {}
-        for item in results:
-            if isinstance(item, BaseException):
-                # This shouldn't happen since _evaluate_single_async catches exceptions
-                continue
-            idx, res = item
-            results_by_index[idx] = res
+        if is_async is None:
+            is_async = _is_async_callable(agent_func)
+        if grader_slots is None:
+            grader_slots = self._new_grader_slots()
+
+        # A fixed pool of workers pulls test cases from a shared iterator, so at
+        # most max_concurrent coroutines exist at once (one per test if unlimited)
+        total = len(suite.test_cases)
+        worker_count = min(max_concurrent, total) if max_concurrent > 0 else total
+        pending = iter(enumerate(suite.test_cases))
+        # Filled in place by index, so results keep the suite's order
+        results: list[EvaluationResult | None] = [None] * total
+
+        # Sync agents get their own threads, one per worker, so a large worker
+        # count isn't capped by the default executor and agent calls don't
+        # queue behind sync graders (or vice versa)
+        executor = None
+        if not is_async and max_concurrent > 0 and total > 0:
+            executor = ThreadPoolExecutor(
+                max_workers=worker_count, thread_name_prefix="evaldeck-agent"
+            )
 
-        for i in range(len(suite.test_cases)):
-            if i in results_by_index:
-                suite_result.add_result(results_by_index[i])
-            else:
-                # Handle case where gather returned an exception
-                suite_result.add_result(
-                    EvaluationResult(
-                        test_case_name=suite.test_cases[i].name,
-                        status=GradeStatus.ERROR,
-                        error="Test execution failed unexpectedly",
-                    )
+        async def worker() -> None:
+            """Run test cases until none are left."""
+            for index, test_case in pending:
+                try:
+                    async with limiter or contextlib.nullcontext():
+                        result = await self._evaluate_single_async(
+                            test_case, agent_func, is_async, executor, grader_slots
+                        )
+                    if on_result:
+                        callback_result = on_result(result)
+                        if inspect.isawaitable(callback_result):
+                            await callback_result
+                except Exception:
+                    # Left as None; reported as an error below
+                    continue
+                results[index] = result
+
+        try:
+            await asyncio.gather(*[worker() for _ in range(worker_count)])
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        for test_case, maybe_result in zip(suite.test_cases, results, strict=True):
+            if maybe_result is None:
+                # Evaluation or the on_result callback raised for this test case
+                maybe_result = EvaluationResult(
+                    test_case_name=test_case.name,
+                    status=GradeStatus.ERROR,
+                    error="Test execution failed unexpectedly",
                 )
+            suite_result.add_result(maybe_result)
 
         suite_result.completed_at = datetime.now()
         return suite_result
@@ -409,6 +660,8 @@ class Evaluator:
         test_case: EvalCase,
         agent_func: Callable[..., Trace] | Callable[..., Awaitable[Trace]],
         is_async: bool,
+        executor: Executor | None = None,
+        grader_slots: asyncio.Semaphore | None = None,
     ) -> EvaluationResult:
         """Evaluate a single test case asynchronously.
 
@@ -422,12 +675,15 @@ class Evaluator:
             agent_func: Function to run the agent. For multi-turn, should accept
                 (input, history) where history is list[Message].
             is_async: Whether agent_func is async.
+            executor: Where to run a sync agent_func. None = default executor.
+            grader_slots: Semaphore limiting I/O-bound grader calls, if any.
 
         Returns:
             EvaluationResult for this test case.
         """
 
         started_at = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         result = EvaluationResult(
             test_case_name=test_case.name,
@@ -442,16 +698,16 @@ class Evaluator:
 
         # Conversation history for multi-turn
         history: list[Message] = []
+        retries = self._retries_for(test_case)
 
         for turn_index, turn in enumerate(test_case.turns):
-            turn_started = datetime.now()
+            turn_started_ns = time.perf_counter_ns()
 
             try:
                 # Run agent with history
-                if is_async:
-                    trace = await agent_func(turn.user, history)  # type: ignore
-                else:
-                    trace = await asyncio.to_thread(agent_func, turn.user, history)
+                trace = await self._run_agent(
+                    agent_func, is_async, turn.user, history, retries, executor
+                )
 
                 # Build graders for this turn
                 graders = self._build_graders_for_turn(turn.expected, turn.graders)
@@ -463,11 +719,13 @@ class Evaluator:
                         user_input=turn.user,
                         status=GradeStatus.PASS,
                         trace_id=trace.id,
-                        duration_ms=(datetime.now() - turn_started).total_seconds() * 1000,
+                        duration_ms=_elapsed_ms(turn_started_ns),
                     )
                 else:
                     # Create a temporary EvalCase for grading this turn
-                    turn_result = await self._evaluate_turn(trace, turn, turn_index, turn_started)
+                    turn_result = await self._evaluate_turn(
+                        trace, turn, turn_index, turn_started_ns, graders, grader_slots
+                    )
 
                 result.add_turn_result(turn_result)
 
@@ -477,17 +735,7 @@ class Evaluator:
 
                 # Fail fast: stop if this turn failed
                 if not turn_result.passed:
-                    # Mark remaining turns as skipped
-                    for skip_index in range(turn_index + 1, len(test_case.turns)):
-                        skip_turn = test_case.turns[skip_index]
-                        result.add_turn_result(
-                            TurnResult(
-                                turn_index=skip_index,
-                                user_input=skip_turn.user,
-                                status=GradeStatus.SKIP,
-                                skipped=True,
-                            )
-                        )
+                    result.add_turn_results(_skipped_turns(test_case.turns, turn_index + 1))
                     break
 
             except Exception as e:
@@ -495,37 +743,68 @@ class Evaluator:
                     turn_index=turn_index,
                     user_input=turn.user,
                     status=GradeStatus.ERROR,
-                    duration_ms=(datetime.now() - turn_started).total_seconds() * 1000,
+                    duration_ms=_elapsed_ms(turn_started_ns),
                 )
                 turn_result.grades.append(
                     GradeResult.error_result("execution", f"Agent error: {e}")
                 )
                 result.add_turn_result(turn_result)
 
-                # Mark remaining turns as skipped
-                for skip_index in range(turn_index + 1, len(test_case.turns)):
-                    skip_turn = test_case.turns[skip_index]
-                    result.add_turn_result(
-                        TurnResult(
-                            turn_index=skip_index,
-                            user_input=skip_turn.user,
-                            status=GradeStatus.SKIP,
-                            skipped=True,
-                        )
-                    )
+                result.add_turn_results(_skipped_turns(test_case.turns, turn_index + 1))
                 break
 
         result.completed_at = datetime.now()
-        result.duration_ms = (result.completed_at - started_at).total_seconds() * 1000
+        result.duration_ms = _elapsed_ms(start_ns)
 
         return result
 
+    def _retries_for(self, test_case: EvalCase) -> int:
+        """Number of agent retries for a test case (test case overrides config)."""
+        if test_case.retries is not None:
+            return test_case.retries
+        if self.config is not None:
+            return self.config.execution.retries
+        return 0
+
+    async def _run_agent(
+        self,
+        agent_func: Callable[..., Trace] | Callable[..., Awaitable[Trace]],
+        is_async: bool,
+        user_input: str,
+        history: list[Message],
+        retries: int,
+        executor: Executor | None = None,
+    ) -> Trace:
+        """Run the agent for one turn, retrying with backoff if it raises.
+
+        Transient failures (rate limits, timeouts from the model provider) are
+        common in long runs; retrying the turn avoids failing the test case.
+
+        Each call gets its own copy of history, so an agent that appends to
+        or keeps the list cannot change the conversation seen by later turns.
+        """
+        attempt = 0
+        while True:
+            try:
+                if is_async:
+                    return await agent_func(user_input, list(history))  # type: ignore
+                return await _to_thread(  # type: ignore[no-any-return]
+                    executor, agent_func, user_input, list(history)
+                )
+            except Exception:
+                if attempt >= retries:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+                attempt += 1
+
     async def _evaluate_turn(
         self,
         trace: Trace,
         turn: Turn,
         turn_index: int,
-        turn_started: datetime,
+        turn_started_ns: int,
+        graders: list[BaseGrader],
+        grader_slots: asyncio.Semaphore | None = None,
     ) -> TurnResult:
         """Evaluate a single turn against its expected behavior.
 
@@ -533,7 +812,9 @@ class Evaluator:
             trace: The trace from this turn's agent execution.
             turn: The turn definition with expected behavior.
             turn_index: Index of this turn in the conversation.
-            turn_started: When this turn started.
+            turn_started_ns: time.perf_counter_ns() when this turn started.
+            graders: Graders built for this turn.
+            grader_slots: Semaphore limiting I/O-bound grader calls, if any.
 
         Returns:
             TurnResult with grades for this turn.
@@ -546,23 +827,28 @@ class Evaluator:
             trace_id=trace.id,
         )
 
-        # Build graders for this turn
-        graders = self._build_graders_for_turn(turn.expected, turn.graders)
+        # Create a minimal test case that graders can use (shared by all graders).
+        # Graders that need expected behavior access turn.expected via
+        # test_case.turns[0].expected. The turn is already validated, so skip
+        # pydantic validation when wrapping it.
+        grader_case = EvalCase.model_construct(name=f"turn_{turn_index}", turns=[turn])
 
         # Run graders concurrently
         async def run_grader(grader: BaseGrader) -> GradeResult:
             try:
-                # Create a minimal test case that graders can use
-                from evaldeck.test_case import EvalCase
+                async with grader_slots or contextlib.nullcontext():
+                    return await grader.grade_async(trace, grader_case)
+            except Exception as e:
+                return GradeResult.error_result(grader.name, f"Grader error: {e}")
 
-                grader_case = EvalCase(name=f"turn_{turn_index}", turns=[turn])
-                # Graders that need expected behavior access turn.expected via test_case.turns[0].expected
-                return await grader.grade_async(trace, grader_case)
+        def grade_inline(grader: BaseGrader) -> GradeResult:
+            try:
+                return grader.grade(trace, grader_case)
             except Exception as e:
                 return GradeResult.error_result(grader.name, f"Grader error: {e}")
 
         if graders:
-            grade_results = await asyncio.gather(*[run_grader(g) for g in graders])
+            grade_results = await _gather_graders(graders, run_grader, grade_inline)
 
             for grade in grade_results:
                 turn_result.grades.append(grade)
@@ -571,7 +857,7 @@ class Evaluator:
                 elif grade.status == GradeStatus.FAIL and turn_result.status != GradeStatus.ERROR:
                     turn_result.status = GradeStatus.FAIL
 
-        turn_result.duration_ms = (datetime.now() - turn_started).total_seconds() * 1000
+        turn_result.duration_ms = _elapsed_ms(turn_started_ns)
 
         return turn_result
 
@@ -591,36 +877,72 @@ class EvaluationRunner:
             config = EvaldeckConfig.load()
         self.config = config
         self.evaluator = Evaluator(config=config)
+        # Response cache the evaluator opened from config, closed by close()
+        self._owned_llm_cache = self.evaluator.llm_cache
+        # asyncio.Runner (Python 3.11+) kept across run() calls, so API clients
+        # and their connection pools, which are per event loop, are reused
+        self._runner: Any = None
+
+    def __enter__(self) -> EvaluationRunner:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release resources held between run() calls.
+
+        Closes the kept event loop, if any, after closing the LLM clients
+        opened on it, and the SQLite response cache opened from config.
+        """
+        if self._runner is not None:
+            self._runner.run(_close_llm_clients())
+            self._runner.close()
+            self._runner = None
+
+        from evaldeck.graders.cache import SQLiteLLMCache
+
+        if isinstance(self._owned_llm_cache, SQLiteLLMCache):
+            self._owned_llm_cache.close()
+        self._owned_llm_cache = None
 
     def run(
         self,
         suites: list[EvalSuite] | None = None,
         agent_func: Callable[[str], Trace] | Callable[[str], Awaitable[Trace]] | None = None,
         tags: list[str] | None = None,
-        on_result: Callable[[EvaluationResult], None] | None = None,
+        on_result: Callable[[EvaluationResult], Awaitable[None] | None] | None = None,
         max_concurrent: int | None = None,
     ) -> RunResult:
         """Run evaluation on multiple suites (sync wrapper).
 
+        On Python 3.11+, repeated calls share one event loop until close() is
+        called (or the runner is used as a context manager and exits).
+
         Args:
             suites: Test suites to run. If None, discovers from config.
             agent_func: Function to run agent. If None, loads from config.
                 Can be sync or async.
             tags: Filter test cases by tags.
-            on_result: Callback for each result.
-            max_concurrent: Max concurrent tests per suite. None = use config.
+            on_result: Callback for each result. May be async.
+            max_concurrent: Max concurrent tests across all suites. None = use config.
 
         Returns:
             RunResult with all suite results.
         """
-        return asyncio.run(self.run_async(suites, agent_func, tags, on_result, max_concurrent))
+        main = self.run_async(suites, agent_func, tags, on_result, max_concurrent)
+        if sys.version_info < (3, 11):
+            return _run(main)
+        if self._runner is None:
+            self._runner = asyncio.Runner(loop_factory=_loop_factory())
+        return self._runner.run(main)
 
     async def run_async(
         self,
         suites: list[EvalSuite] | None = None,
         agent_func: Callable[[str], Trace] | Callable[[str], Awaitable[Trace]] | None = None,
         tags: list[str] | None = None,
-        on_result: Callable[[EvaluationResult], None] | None = None,
+        on_result: Callable[[EvaluationResult], Awaitable[None] | None] | None = None,
         max_concurrent: int | None = None,
     ) -> RunResult:
         """Run evaluation on multiple suites asynchronously.
@@ -630,8 +952,8 @@ class EvaluationRunner:
             agent_func: Function to run agent. If None, loads from config.
                 Can be sync or async.
             tags: Filter test cases by tags.
-            on_result: Callback for each result.
-            max_concurrent: Max concurrent tests per suite. None = use config.
+            on_result: Callback for each result. May be async.
+            max_concurrent: Max concurrent tests across all suites. None = use config.
 
         Returns:
             RunResult with all suite results.
@@ -659,16 +981,32 @@ class EvaluationRunner:
             config=self.config.model_dump(),
         )
 
-        for suite in suites:
-            if not suite.test_cases:
-                continue
-
-            suite_result = await self.evaluator.evaluate_suite_async(
-                suite=suite,
-                agent_func=agent_func,
-                on_result=on_result,
-                max_concurrent=effective_max_concurrent,
-            )
+        # Detect once rather than for every suite
+        is_async = _is_async_callable(agent_func)
+
+        # Suites run side by side; one semaphore keeps the total number of
+        # test cases in flight within max_concurrent, another caps grader calls
+        limiter = None
+        if effective_max_concurrent > 0:
+            limiter = asyncio.Semaphore(effective_max_concurrent)
+        grader_slots = self.evaluator._new_grader_slots()
+
+        suite_results = await asyncio.gather(
+            *[
+                self.evaluator.evaluate_suite_async(
+                    suite=suite,
+                    agent_func=agent_func,
+                    on_result=on_result,
+                    max_concurrent=effective_max_concurrent,
+                    is_async=is_async,
+                    limiter=limiter,
+                    grader_slots=grader_slots,
+                )
+                for suite in suites
+                if suite.test_cases
+            ]
+        )
+        for suite_result in suite_results:
             run_result.add_suite(suite_result)
 
         run_result.completed_at = datetime.now()
@@ -676,36 +1014,9 @@ class EvaluationRunner:
 
     def _discover_suites(self) -> list[EvalSuite]:
         """Discover test suites from configuration."""
-        from pathlib import Path
-
-        from evaldeck.test_case import EvalSuite
-
-        suites = []
-
-        # Use configured suites
-        if self.config.suites:
-            for suite_config in self.config.suites:
-                path = Path(suite_config.path)
-                if path.is_dir():
-                    suite = EvalSuite.from_directory(path, name=suite_config.name)
-                    suites.append(suite)
-
-        # Or discover from test_dir
-        else:
-            test_dir = Path(self.config.test_dir)
-            if test_dir.is_dir():
-                # Check for subdirectories (each is a suite)
-                subdirs = [d for d in test_dir.iterdir() if d.is_dir()]
-                if subdirs:
-                    for subdir in subdirs:
-                        suite = EvalSuite.from_directory(subdir)
-                        suites.append(suite)
-                else:
-                    # Single suite from test_dir
-                    suite = EvalSuite.from_directory(test_dir, name="default")
-                    suites.append(suite)
+        from evaldeck.test_case import discover_suites
 
-        return suites
+        return discover_suites(self.config)
 
     def _load_agent_func(self) -> Callable[..., Trace]:
         """Load agent function from configuration.
@@ -1,21 +1,26 @@
 """Graders for evaluating agent traces."""
 
-from evaldeck.graders.base import BaseGrader, CompositeGrader
-from evaldeck.graders.code import (
-    ContainsGrader,
-    CustomGrader,
-    EqualsGrader,
-    MaxLLMCallsGrader,
-    MaxStepsGrader,
-    MaxToolCallsGrader,
-    NotContainsGrader,
-    RegexGrader,
-    TaskCompletedGrader,
-    ToolCalledGrader,
-    ToolNotCalledGrader,
-    ToolOrderGrader,
-)
-from evaldeck.graders.llm import LLMGrader, LLMRubricGrader
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from evaldeck.graders.base import BaseGrader, CompositeGrader
+    from evaldeck.graders.cache import LLMCache, MemoryLLMCache, SQLiteLLMCache
+    from evaldeck.graders.code import (
+        ContainsGrader,
+        CustomGrader,
+        EqualsGrader,
+        MaxLLMCallsGrader,
+        MaxStepsGrader,
+        MaxToolCallsGrader,
+        NotContainsGrader,
+        RegexGrader,
+        TaskCompletedGrader,
+        ToolCalledGrader,
+        ToolNotCalledGrader,
+        ToolOrderGrader,
+    )
+    from evaldeck.graders.llm import LLMGrader, LLMRubricGrader
 
 __all__ = [
     # Base
@@ -37,4 +42,45 @@ __all__ = [
     # Model-based
     "LLMGrader",
     "LLMRubricGrader",
+    # LLM response caches
+    "LLMCache",
+    "MemoryLLMCache",
+    "SQLiteLLMCache",
 ]
+
+# Grader modules are imported on first attribute access, so code that only
+# uses the deterministic graders never loads the LLM grader or cache modules.
+_EXPORTS = {
+    "BaseGrader": "evaldeck.graders.base",
+    "CompositeGrader": "evaldeck.graders.base",
+    "ContainsGrader": "evaldeck.graders.code",
+    "NotContainsGrader": "evaldeck.graders.code",
+    "EqualsGrader": "evaldeck.graders.code",
+    "RegexGrader": "evaldeck.graders.code",
+    "ToolCalledGrader": "evaldeck.graders.code",
+    "ToolNotCalledGrader": "evaldeck.graders.code",
+    "ToolOrderGrader": "evaldeck.graders.code",
+    "MaxStepsGrader": "evaldeck.graders.code",
+    "MaxToolCallsGrader": "evaldeck.graders.code",
+    "MaxLLMCallsGrader": "evaldeck.graders.code",
+    "TaskCompletedGrader": "evaldeck.graders.code",
+    "CustomGrader": "evaldeck.graders.code",
+    "LLMGrader": "evaldeck.graders.llm",
+    "LLMRubricGrader": "evaldeck.graders.llm",
+    "LLMCache": "evaldeck.graders.cache",
+    "MemoryLLMCache": "evaldeck.graders.cache",
+    "SQLiteLLMCache": "evaldeck.graders.cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -22,6 +22,8 @@ class BaseGrader(ABC):
     Async behavior:
         - Default grade_async() runs sync grade() in a thread pool
         - Override grade_async() for true async I/O (e.g., LLMGrader)
+        - Set is_io_bound = False for cheap, non-blocking graders; grade()
+          is then called inline on the event loop instead
         - When using Evaluator.evaluate_async(), all graders run concurrently
 
     Creating a custom async grader::
@@ -42,6 +44,16 @@ class BaseGrader(ABC):
 
     name: str = "base"
 
+    # Names of graders that must not fail for this one to run. When any of
+    # them fails or errors, the evaluator records this grader as skipped
+    # instead of running it (e.g. to avoid paying for an LLM call).
+    skip_if_failed: list[str] | None = None
+
+    # Whether grading may block (network, disk, subprocesses). Graders that
+    # only inspect the trace in memory set this to False so async evaluation
+    # calls grade() directly rather than handing it to a worker thread.
+    is_io_bound: bool = True
+
     @abstractmethod
     def grade(self, trace: Trace, test_case: EvalCase) -> GradeResult:
         """Evaluate the trace and return a grade result.
@@ -58,8 +70,9 @@ class BaseGrader(ABC):
     async def grade_async(self, trace: Trace, test_case: EvalCase) -> GradeResult:
         """Async version of grade.
 
-        Default implementation runs sync grade() in a thread pool.
-        Override this method for true async behavior (e.g., async API calls).
+        Default implementation runs sync grade() in a thread pool, or calls it
+        directly when is_io_bound is False. Override this method for true
+        async behavior (e.g., async API calls).
 
         Args:
             trace: The execution trace to evaluate.
@@ -68,6 +81,8 @@ class BaseGrader(ABC):
         Returns:
             GradeResult indicating pass/fail and details.
         """
+        if not self.is_io_bound:
+            return self.grade(trace, test_case)
         return await asyncio.to_thread(self.grade, trace, test_case)
 
     def __repr__(self) -> str:
@@ -95,37 +110,60 @@ class CompositeGrader(BaseGrader):
         """
         self.graders = graders
         self.require_all = require_all
+        self.is_io_bound = any(grader.is_io_bound for grader in graders)
 
     def grade(self, trace: Trace, test_case: EvalCase) -> GradeResult:
-        """Run all graders and combine results."""
+        """Run graders in order until the outcome is decided, then combine results."""
         results: list[GradeResult] = []
         for grader in self.graders:
             result = grader.grade(trace, test_case)
             results.append(result)
+            if self._decides(result):
+                break
 
         return self._combine_results(results)
 
     async def grade_async(self, trace: Trace, test_case: EvalCase) -> GradeResult:
-        """Run all graders concurrently and combine results."""
-        tasks = [grader.grade_async(trace, test_case) for grader in self.graders]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle any exceptions
-        grade_results: list[GradeResult] = []
-        for i, result in enumerate(results):
-            if isinstance(result, BaseException):
-                grade_results.append(
-                    GradeResult.error_result(self.graders[i].name, f"Grader error: {result}")
-                )
-            else:
-                grade_results.append(result)
-
-        return self._combine_results(grade_results)
+        """Run all graders concurrently and combine results.
+
+        Graders still running once the outcome is decided (a failure when
+        require_all, a pass otherwise) are cancelled.
+        """
+        tasks = [
+            asyncio.ensure_future(self._grade_one_async(grader, trace, test_case))
+            for grader in self.graders
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                if self._decides(await next_done):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancellations finish so every task is settled before returning
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Keep grader order, leaving out graders cancelled before they finished
+        results = [task.result() for task in tasks if not task.cancelled()]
+        return self._combine_results(results)
+
+    async def _grade_one_async(
+        self, grader: BaseGrader, trace: Trace, test_case: EvalCase
+    ) -> GradeResult:
+        """Run one sub-grader, turning an exception into an error result."""
+        try:
+            return await grader.grade_async(trace, test_case)
+        except Exception as e:
+            return GradeResult.error_result(grader.name, f"Grader error: {e}")
+
+    def _decides(self, result: GradeResult) -> bool:
+        """Whether this result alone settles the composite outcome."""
+        return result.passed != self.require_all
 
     def _combine_results(self, results: list[GradeResult]) -> GradeResult:
         """Combine multiple grader results into one."""
         passed_count = sum(1 for r in results if r.passed)
-        total = len(results)
+        total = len(self.graders)
 
         if self.require_all:
             # All must pass
@@ -138,6 +176,9 @@ class CompositeGrader(BaseGrader):
             status = GradeStatus.PASS if any_passed else GradeStatus.FAIL
             message = f"{passed_count}/{total} graders passed (require any)"
 
+        if len(results) < total:
+            message += f", {total - len(results)} not run"
+
         return GradeResult(
             grader_name=self.name,
             status=status,
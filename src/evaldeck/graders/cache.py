@@ -0,0 +1,122 @@
+"""Response caches for LLM-based graders.
+
+Re-running an eval suite during development sends the same grading prompts
+to the same model over and over. Caching the raw responses makes replayed
+grades free and near-instant.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class LLMCache(ABC):
+    """Base class for LLM response caches.
+
+    Implementations must be safe to call from multiple threads, since sync
+    graders run in a thread pool during async evaluation.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Return the cached response for a key, or None on a miss."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: str) -> None:
+        """Store a response under a key."""
+        pass
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: float,
+        prompt: str,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Build a cache key from everything that determines the response."""
+        parts = [provider, model, repr(temperature), prompt]
+        if max_tokens is not None:
+            parts.append(str(max_tokens))
+        payload = "\x00".join(parts)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemoryLLMCache(LLMCache):
+    """In-process cache. Lives as long as the cache object."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            return self._data.get(key)
+
+    def set(self, key: str, response: str) -> None:
+        with self._lock:
+            self._data[key] = response
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteLLMCache(LLMCache):
+    """On-disk cache that persists across runs."""
+
+    def __init__(self, path: str | Path = ".evaldeck/llm_cache.db") -> None:
+        """Initialize SQLite cache.
+
+        Args:
+            path: Database file. Parent directories are created if needed.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, response: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                (key, response),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def create_llm_cache(backend: str, path: str | Path | None = None) -> LLMCache:
+    """Create a cache from a backend name.
+
+    Args:
+        backend: "memory" or "sqlite".
+        path: Database file for the sqlite backend.
+
+    Returns:
+        The configured cache.
+    """
+    backend = backend.lower()
+    if backend == "memory":
+        return MemoryLLMCache()
+    if backend == "sqlite":
+        return SQLiteLLMCache(path) if path else SQLiteLLMCache()
+    raise ValueError(f"Unknown LLM cache backend: {backend}. Use 'memory' or 'sqlite'.")
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import importlib
 import re
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from evaldeck.graders.base import BaseGrader
 from evaldeck.results import GradeResult
@@ -16,10 +17,65 @@ if TYPE_CHECKING:
     from evaldeck.trace import Trace
 
 
+def _normalize(trace: Trace, values: list[str], case_sensitive: bool) -> tuple[str, list[str]]:
+    """Output and values to compare, casefolded for case-insensitive checks."""
+    if case_sensitive:
+        return trace.output or "", values
+    return trace.output_casefolded, list(_casefold_all(tuple(values)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _casefold_all(values: tuple[str, ...]) -> tuple[str, ...]:
+    """Casefolded values, cached since the same lists are checked for every trace."""
+    return tuple(value.casefold() for value in values)
+
+
+# Below this many values, one `in` scan per value beats walking an automaton
+_MULTI_SCAN_MIN_VALUES = 8
+
+
+@functools.lru_cache(maxsize=256)
+def _keyword_automaton(needles: tuple[str, ...]) -> Any:
+    """Aho-Corasick automaton over needles, or None if pyahocorasick isn't installed."""
+    words = {needle for needle in needles if needle}
+    if not words:
+        return None
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+def _present(content: str, needles: list[str]) -> list[bool]:
+    """Whether each needle occurs in content.
+
+    With many needles and pyahocorasick installed, content is scanned once for
+    all of them rather than once per needle.
+    """
+    if len(needles) >= _MULTI_SCAN_MIN_VALUES:
+        automaton = _keyword_automaton(tuple(needles))
+        if automaton is not None:
+            hits = {word for _, word in automaton.iter(content)}
+            return [not needle or needle in hits for needle in needles]
+    return [needle in content for needle in needles]
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(pattern: str, flags: int) -> re.Pattern[str]:
+    """re.compile with a cache that isn't shared with (and evicted by) other code."""
+    return re.compile(pattern, flags)
+
+
 class ContainsGrader(BaseGrader):
     """Check if output contains expected values."""
 
     name = "contains"
+    is_io_bound = False
 
     def __init__(
         self,
@@ -49,16 +105,14 @@ class ContainsGrader(BaseGrader):
             return GradeResult.passed_result(self.name, "No values to check")
 
         # Get content to check
-        content = trace.output or ""
-        if not self.case_sensitive:
-            content = content.lower()
+        content, needles = _normalize(trace, values, self.case_sensitive)
 
         # Check each value
-        missing = []
-        for value in values:
-            check_value = value if self.case_sensitive else value.lower()
-            if check_value not in content:
-                missing.append(value)
+        missing = [
+            value
+            for value, present in zip(values, _present(content, needles), strict=True)
+            if not present
+        ]
 
         if missing:
             return GradeResult.failed_result(
@@ -78,6 +132,7 @@ class NotContainsGrader(BaseGrader):
     """Check that output does NOT contain certain values."""
 
     name = "not_contains"
+    is_io_bound = False
 
     def __init__(
         self,
@@ -98,15 +153,13 @@ class NotContainsGrader(BaseGrader):
         if not values:
             return GradeResult.passed_result(self.name, "No values to check")
 
-        content = trace.output or ""
-        if not self.case_sensitive:
-            content = content.lower()
+        content, needles = _normalize(trace, values, self.case_sensitive)
 
-        found = []
-        for value in values:
-            check_value = value if self.case_sensitive else value.lower()
-            if check_value in content:
-                found.append(value)
+        found = [
+            value
+            for value, present in zip(values, _present(content, needles), strict=True)
+            if present
+        ]
 
         if found:
             return GradeResult.failed_result(
@@ -123,6 +176,7 @@ class EqualsGrader(BaseGrader):
     """Check if output exactly equals expected value."""
 
     name = "equals"
+    is_io_bound = False
 
     def __init__(
         self,
@@ -142,12 +196,16 @@ class EqualsGrader(BaseGrader):
 
         actual = trace.output or ""
 
+        # Equal as given means equal after normalizing too, so skip rebuilding both
+        if actual == expected:
+            return GradeResult.passed_result(self.name, "Output matches expected")
+
         if self.normalize_whitespace:
             expected = " ".join(expected.split())
             actual = " ".join(actual.split())
 
-        if actual == expected:
-            return GradeResult.passed_result(self.name, "Output matches expected")
+            if actual == expected:
+                return GradeResult.passed_result(self.name, "Output matches expected")
 
         return GradeResult.failed_result(
             self.name,
@@ -161,6 +219,7 @@ class RegexGrader(BaseGrader):
     """Check if output matches a regex pattern."""
 
     name = "regex"
+    is_io_bound = False
 
     def __init__(
         self,
@@ -181,7 +240,7 @@ class RegexGrader(BaseGrader):
         content = trace.output or ""
 
         try:
-            if re.search(pattern, content, self.flags):
+            if _compile(pattern, self.flags).search(content):
                 return GradeResult.passed_result(
                     self.name,
                     f"Output matches pattern: {pattern}",
@@ -200,6 +259,7 @@ class ToolCalledGrader(BaseGrader):
     """Check that required tools were called."""
 
     name = "tool_called"
+    is_io_bound = False
 
     def __init__(self, required: list[str] | None = None) -> None:
         """Initialize tool called grader.
@@ -219,9 +279,8 @@ class ToolCalledGrader(BaseGrader):
         if not required:
             return GradeResult.passed_result(self.name, "No required tools to check")
 
-        called = set(trace.tools_called)
-        required_set = set(required)
-        missing = required_set - called
+        called = trace.tools_called_set
+        missing = set(required).difference(called)
 
         if missing:
             return GradeResult.failed_result(
@@ -241,6 +300,7 @@ class ToolNotCalledGrader(BaseGrader):
     """Check that certain tools were NOT called."""
 
     name = "tool_not_called"
+    is_io_bound = False
 
     def __init__(self, forbidden: list[str] | None = None) -> None:
         self.forbidden = forbidden
@@ -254,9 +314,8 @@ class ToolNotCalledGrader(BaseGrader):
         if not forbidden:
             return GradeResult.passed_result(self.name, "No forbidden tools to check")
 
-        called = set(trace.tools_called)
-        forbidden_set = set(forbidden)
-        violated = called & forbidden_set
+        called = trace.tools_called_set
+        violated = called.intersection(forbidden)
 
         if violated:
             return GradeResult.failed_result(
@@ -273,6 +332,7 @@ class ToolOrderGrader(BaseGrader):
     """Check that tools were called in the correct order."""
 
     name = "tool_order"
+    is_io_bound = False
 
     def __init__(self, expected_order: list[str] | None = None) -> None:
         self.expected_order = expected_order
@@ -288,13 +348,10 @@ class ToolOrderGrader(BaseGrader):
 
         actual = trace.tools_called
 
-        # Check if expected is a subsequence of actual
-        expected_idx = 0
-        for tool in actual:
-            if expected_idx < len(expected) and tool == expected[expected_idx]:
-                expected_idx += 1
-
-        if expected_idx == len(expected):
+        # Check if expected is a subsequence of actual: each `in` consumes the
+        # iterator up to its match, so later tools are only found after earlier ones
+        remaining = iter(actual)
+        if all(tool in remaining for tool in expected):
             return GradeResult.passed_result(
                 self.name,
                 "Tools called in correct order",
@@ -312,6 +369,7 @@ class MaxStepsGrader(BaseGrader):
     """Check that agent completed within maximum steps."""
 
     name = "max_steps"
+    is_io_bound = False
 
     def __init__(self, max_steps: int | None = None) -> None:
         self.max_steps = max_steps
@@ -349,6 +407,7 @@ class MaxToolCallsGrader(BaseGrader):
     """
 
     name = "max_tool_calls"
+    is_io_bound = False
 
     def __init__(self, max_tool_calls: int | None = None) -> None:
         self.max_tool_calls = max_tool_calls
@@ -362,7 +421,7 @@ class MaxToolCallsGrader(BaseGrader):
         if max_tool_calls is None:
             return GradeResult.passed_result(self.name, "No max tool calls defined")
 
-        actual = len(trace.tool_calls)
+        actual = trace.tool_call_count
 
         if actual <= max_tool_calls:
             return GradeResult.passed_result(
@@ -385,6 +444,7 @@ class MaxLLMCallsGrader(BaseGrader):
     """
 
     name = "max_llm_calls"
+    is_io_bound = False
 
     def __init__(self, max_llm_calls: int | None = None) -> None:
         self.max_llm_calls = max_llm_calls
@@ -398,7 +458,7 @@ class MaxLLMCallsGrader(BaseGrader):
         if max_llm_calls is None:
             return GradeResult.passed_result(self.name, "No max LLM calls defined")
 
-        actual = len(trace.llm_calls)
+        actual = trace.llm_call_count
 
         if actual <= max_llm_calls:
             return GradeResult.passed_result(
@@ -418,6 +478,7 @@ class TaskCompletedGrader(BaseGrader):
     """Check if the agent completed the task (based on trace status)."""
 
     name = "task_completed"
+    is_io_bound = False
 
     def __init__(self, require_success: bool = True) -> None:
         self.require_success = require_success
@@ -509,6 +570,15 @@ class CustomGrader(BaseGrader):
         self.module_name = module
         self.function_name = function
         self._loaded_func: Callable[..., GradeResult] | None = None
+        self._load_error: Exception | None = None
+
+        # Import now rather than on first grade, when concurrent grades would
+        # all queue on the import lock. Errors are reported when grading.
+        if func is None and module and function:
+            try:
+                self._loaded_func = getattr(importlib.import_module(module), function)
+            except Exception as e:
+                self._load_error = e
 
     def _get_func(self) -> Callable[[Trace, EvalCase], GradeResult]:
         """Get the grading function."""
@@ -518,10 +588,8 @@ class CustomGrader(BaseGrader):
         if self._loaded_func is not None:
             return self._loaded_func
 
-        if self.module_name and self.function_name:
-            module = importlib.import_module(self.module_name)
-            self._loaded_func = getattr(module, self.function_name)
-            return self._loaded_func
+        if self._load_error is not None:
+            raise self._load_error
 
         raise ValueError("CustomGrader requires either func or module+function")
 
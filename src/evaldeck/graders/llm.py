@@ -2,16 +2,112 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import re
+import string
+import threading
+import weakref
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
 from evaldeck.graders.base import BaseGrader
+from evaldeck.graders.cache import LLMCache
 from evaldeck.results import GradeResult, GradeStatus
+from evaldeck.trace import StepType
 
 if TYPE_CHECKING:
     from evaldeck.test_case import EvalCase
-    from evaldeck.trace import Trace
+    from evaldeck.trace import Step, Trace
+
+# API clients shared across grader instances, keyed by (client class, API key),
+# so HTTP connection pools are reused between test cases instead of being
+# rebuilt for every call. Async clients are bound to the event loop they were
+# created on, so they are kept per loop. Their pooled connections keep the loop
+# alive, so whoever owns a loop closes them with aclose_async_clients() before
+# tearing it down.
+_sync_clients: dict[tuple[str, str], Any] = {}
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], Any]] = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+# Provider requests in flight per event loop, keyed by cache key. Graders with a
+# cache await the same request when an identical prompt is already being sent,
+# rather than sending it again before the first response is cached.
+_inflight_requests: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Future[str]]
+] = weakref.WeakKeyDictionary()
+
+
+def _shared_client(factory: Callable[..., Any], api_key: str) -> Any:
+    """Return a shared sync client, creating it on first use."""
+    key = (factory.__qualname__, api_key)
+    with _clients_lock:
+        client = _sync_clients.get(key)
+        if client is None:
+            client = factory(api_key=api_key)
+            _sync_clients[key] = client
+    return client
+
+
+def _shared_async_client(factory: Callable[..., Any], api_key: str) -> Any:
+    """Return a shared async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = (factory.__qualname__, api_key)
+    with _clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = factory(api_key=api_key)
+            clients[key] = client
+    return client
+
+
+async def aclose_async_clients() -> None:
+    """Close the shared async clients created on the running event loop.
+
+    Call this before closing a loop that ran LLM graders, so their pooled
+    connections are closed rather than left open. evaldeck does this for the
+    loops it creates itself.
+    """
+    with _clients_lock:
+        clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    await asyncio.gather(*(client.close() for client in clients.values()), return_exceptions=True)
+
+
+# Patterns for parsing grader responses
+_VERDICT_RE = re.compile(r"VERDICT:\s*(PASS|FAIL)", re.IGNORECASE)
+_PASS_FAIL_RE = re.compile(r"PASS|FAIL", re.IGNORECASE)
+_REASON_RE = re.compile(r"REASON:\s*(.+)", re.IGNORECASE | re.DOTALL)
+_SCORE_RE = re.compile(r"SCORE:\s*(\d+(?:\.\d+)?)")
+
+
+def _summarize_tool_call(i: int, step: Step) -> str:
+    """Summary of a tool call step, with a preview of its result."""
+    line = f"  {i}. Tool: {step.tool_name}({step.tool_args})"
+    if step.tool_result:
+        line += f"\n      Result: {str(step.tool_result)[:200]}"
+    return line
+
+
+# Trace summary line(s) for each step type; other step types are left out
+_STEP_SUMMARIES: dict[StepType, Callable[[int, Step], str]] = {
+    StepType.TOOL_CALL: _summarize_tool_call,
+    StepType.LLM_CALL: lambda i, step: f"  {i}. LLM: {(step.output or '')[:100]}...",
+    StepType.REASONING: lambda i, step: f"  {i}. Reasoning: {(step.reasoning_text or '')[:100]}...",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _template_fields(template: str) -> frozenset[str]:
+    """Names of the placeholders a prompt template uses."""
+    return frozenset(
+        re.split(r"[.\[]", field, maxsplit=1)[0]
+        for _, field, _, _ in string.Formatter().parse(template)
+        if field
+    )
 
 
 class LLMGrader(BaseGrader):
@@ -51,6 +147,9 @@ REASON: Your explanation
         threshold: float | None = None,
         temperature: float = 0.0,
         task: str | None = None,
+        cache: LLMCache | None = None,
+        skip_if_failed: list[str] | None = None,
+        max_tokens: int | None = None,
     ) -> None:
         """Initialize LLM grader.
 
@@ -62,6 +161,13 @@ REASON: Your explanation
             threshold: Score threshold for pass (if using scored evaluation).
             temperature: Model temperature.
             task: Task description for the default prompt.
+            cache: Optional response cache. Identical prompts sent to the same
+                model reuse the cached response instead of calling the API.
+            skip_if_failed: Grader names (e.g. ["tool_called"]) that must not
+                fail for this grader to run. Skipping saves the LLM call when a
+                deterministic check has already failed the test.
+            max_tokens: Cap on response tokens. Verdicts are short, so a low cap
+                (e.g. 256) bounds latency and cost. Anthropic defaults to 1024.
         """
         self.prompt_template = prompt or self.DEFAULT_PROMPT
         self.model = model
@@ -70,6 +176,9 @@ REASON: Your explanation
         self.threshold = threshold
         self.temperature = temperature
         self.task = task or "Determine if the agent completed the task correctly."
+        self.cache = cache
+        self.skip_if_failed = skip_if_failed
+        self.max_tokens = max_tokens
 
     def _detect_provider(self, model: str) -> str:
         """Detect API provider from model name."""
@@ -96,10 +205,31 @@ REASON: Your explanation
             return key
         raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
 
+    def _get_cached(self, prompt: str) -> str | None:
+        """Look up a cached response for a prompt."""
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(prompt))
+
+    def _store_cached(self, prompt: str, response: str) -> None:
+        """Store a response in the cache, if one is configured."""
+        if self.cache is not None:
+            self.cache.set(self._cache_key(prompt), response)
+
+    def _cache_key(self, prompt: str) -> str:
+        """Cache key covering every setting that affects the response."""
+        return LLMCache.make_key(
+            self.provider, self.model, self.temperature, prompt, self.max_tokens
+        )
+
     def _format_prompt(self, trace: Trace, test_case: EvalCase) -> str:
         """Format the grading prompt with trace data."""
-        # Build trace summary
-        trace_summary = self._build_trace_summary(trace)
+        # Only build the trace summary and expected dump if the template uses them
+        fields = _template_fields(self.prompt_template)
+        trace_summary = self._build_trace_summary(trace) if "trace" in fields else ""
+        expected = ""
+        if "expected" in fields:
+            expected = str(test_case.expected.model_dump(exclude_none=True))
 
         return self.prompt_template.format(
             input=trace.input,
@@ -107,25 +237,28 @@ REASON: Your explanation
             trace=trace_summary,
             task=self.task,
             test_case_name=test_case.name,
-            expected=str(test_case.expected.model_dump(exclude_none=True)),
+            expected=expected,
         )
 
     def _build_trace_summary(self, trace: Trace) -> str:
         """Build a human-readable trace summary."""
-        lines = ["Execution Trace:"]
-        for i, step in enumerate(trace.steps, 1):
-            if step.type.value == "tool_call":
-                lines.append(f"  {i}. Tool: {step.tool_name}({step.tool_args})")
-                if step.tool_result:
-                    result_str = str(step.tool_result)[:200]
-                    lines.append(f"      Result: {result_str}")
-            elif step.type.value == "llm_call":
-                output_preview = (step.output or "")[:100]
-                lines.append(f"  {i}. LLM: {output_preview}...")
-            elif step.type.value == "reasoning":
-                reasoning_preview = (step.reasoning_text or "")[:100]
-                lines.append(f"  {i}. Reasoning: {reasoning_preview}...")
-        return "\n".join(lines)
+        summaries = _STEP_SUMMARIES
+        return "\n".join(
+            [
+                "Execution Trace:",
+                *(
+                    summaries[step.type](i, step)
+                    for i, step in enumerate(trace.steps, 1)
+                    if step.type in summaries
+                ),
+            ]
+        )
+
+    def _openai_options(self) -> dict[str, Any]:
+        """Optional request parameters for the OpenAI API."""
+        if self.max_tokens is None:
+            return {}
+        return {"max_tokens": self.max_tokens}
 
     def _call_openai(self, prompt: str) -> str:
         """Call OpenAI API (sync)."""
@@ -136,11 +269,12 @@ REASON: Your explanation
                 "OpenAI package not installed. Run: pip install evaldeck[openai]"
             ) from None
 
-        client = OpenAI(api_key=self._get_api_key())
+        client = _shared_client(OpenAI, self._get_api_key())
         response = client.chat.completions.create(
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=self.temperature,
+            **self._openai_options(),
         )
         return response.choices[0].message.content or ""
 
@@ -153,11 +287,12 @@ REASON: Your explanation
                 "OpenAI package not installed. Run: pip install evaldeck[openai]"
             ) from None
 
-        client = AsyncOpenAI(api_key=self._get_api_key())
+        client = _shared_async_client(AsyncOpenAI, self._get_api_key())
         response = await client.chat.completions.create(
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=self.temperature,
+            **self._openai_options(),
         )
         return response.choices[0].message.content or ""
 
@@ -171,10 +306,10 @@ REASON: Your explanation
                 "Anthropic package not installed. Run: pip install evaldeck[anthropic]"
             ) from None
 
-        client = Anthropic(api_key=self._get_api_key())
+        client = _shared_client(Anthropic, self._get_api_key())
         response = client.messages.create(
             model=self.model,
-            max_tokens=1024,
+            max_tokens=self.max_tokens or 1024,
             messages=[{"role": "user", "content": prompt}],
         )
         # Extract text from first TextBlock
@@ -193,10 +328,10 @@ REASON: Your explanation
                 "Anthropic package not installed. Run: pip install evaldeck[anthropic]"
             ) from None
 
-        client = AsyncAnthropic(api_key=self._get_api_key())
+        client = _shared_async_client(AsyncAnthropic, self._get_api_key())
         response = await client.messages.create(
             model=self.model,
-            max_tokens=1024,
+            max_tokens=self.max_tokens or 1024,
             messages=[{"role": "user", "content": prompt}],
         )
         # Extract text from first TextBlock
@@ -211,27 +346,24 @@ REASON: Your explanation
         Returns:
             Tuple of (status, reason, score).
         """
-        response_upper = response.upper()
-
         # Look for explicit VERDICT: PASS/FAIL
-        verdict_match = re.search(r"VERDICT:\s*(PASS|FAIL)", response_upper)
+        verdict_match = _VERDICT_RE.search(response)
         if verdict_match:
-            status = GradeStatus.PASS if verdict_match.group(1) == "PASS" else GradeStatus.FAIL
-        elif "PASS" in response_upper and "FAIL" not in response_upper:
+            passed = verdict_match.group(1).upper() == "PASS"
+            status = GradeStatus.PASS if passed else GradeStatus.FAIL
+        elif {word.upper() for word in _PASS_FAIL_RE.findall(response)} == {"PASS"}:
             status = GradeStatus.PASS
-        elif "FAIL" in response_upper:
-            status = GradeStatus.FAIL
         else:
-            # Couldn't determine, default to fail
+            # FAIL mentioned, or couldn't determine; default to fail
             status = GradeStatus.FAIL
 
         # Extract reason
-        reason_match = re.search(r"REASON:\s*(.+)", response, re.IGNORECASE | re.DOTALL)
+        reason_match = _REASON_RE.search(response)
         reason = reason_match.group(1).strip() if reason_match else response[:200]
 
         # Extract score if present
         score = None
-        score_match = re.search(r"SCORE:\s*(\d+(?:\.\d+)?)", response)
+        score_match = _SCORE_RE.search(response)
         if score_match:
             score = float(score_match.group(1))
             # Normalize to 0-1 if needed
@@ -246,12 +378,19 @@ REASON: Your explanation
             # Format prompt
             prompt = self._format_prompt(trace, test_case)
 
+            # Reuse a cached response if available
+            cached = self._get_cached(prompt)
+            if cached is not None:
+                return self._build_result(cached, cached=True)
+
             # Call LLM
             if self.provider == "anthropic":
                 response = self._call_anthropic(prompt)
             else:
                 response = self._call_openai(prompt)
 
+            self._store_cached(prompt, response)
+
             return self._build_result(response)
 
         except Exception as e:
@@ -266,18 +405,75 @@ REASON: Your explanation
             # Format prompt
             prompt = self._format_prompt(trace, test_case)
 
+            # Reuse a cached response if available
+            cached = self._get_cached(prompt)
+            if cached is not None:
+                return self._build_result(cached, cached=True)
+
             # Call LLM asynchronously
-            if self.provider == "anthropic":
-                response = await self._call_anthropic_async(prompt)
-            else:
-                response = await self._call_openai_async(prompt)
+            response = await self._request_async(prompt)
+
+            self._store_cached(prompt, response)
 
             return self._build_result(response)
 
         except Exception as e:
             return GradeResult.error_result(self.name, f"LLM grader error: {e}")
 
-    def _build_result(self, response: str) -> GradeResult:
+    async def grade_many_async(
+        self,
+        pairs: Iterable[tuple[Trace, EvalCase]],
+        concurrency: int = 16,
+    ) -> list[GradeResult]:
+        """Grade many traces concurrently, e.g. to re-score saved traces.
+
+        Requests go through the shared async client for the running loop, so
+        they reuse its connection pool.
+
+        Args:
+            pairs: (trace, test_case) pairs to grade.
+            concurrency: Maximum number of grades in flight at once.
+
+        Returns:
+            One GradeResult per pair, in the same order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def grade_one(trace: Trace, test_case: EvalCase) -> GradeResult:
+            async with semaphore:
+                return await self.grade_async(trace, test_case)
+
+        return list(await asyncio.gather(*(grade_one(t, c) for t, c in pairs)))
+
+    async def _request_async(self, prompt: str) -> str:
+        """Send a prompt, sharing one request between identical concurrent prompts.
+
+        Only done when a cache is configured, i.e. when identical prompts are
+        already meant to share a response.
+        """
+        if self.cache is None:
+            return await self._call_provider_async(prompt)
+
+        key = self._cache_key(prompt)
+        with _clients_lock:
+            requests = _inflight_requests.setdefault(asyncio.get_running_loop(), {})
+        request = requests.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._call_provider_async(prompt))
+            requests[key] = request
+            request.add_done_callback(lambda _: requests.pop(key, None))
+        # Shielded so a cancelled grade doesn't cancel the request for the others
+        return await asyncio.shield(request)
+
+    async def _call_provider_async(self, prompt: str) -> str:
+        """Call the configured provider (async)."""
+        if self.provider == "anthropic":
+            return await self._call_anthropic_async(prompt)
+        return await self._call_openai_async(prompt)
+
+    def _build_result(self, response: str, cached: bool = False) -> GradeResult:
         """Build GradeResult from LLM response."""
         # Parse response
         status, reason, score = self._parse_response(response)
@@ -294,6 +490,7 @@ REASON: Your explanation
             details={
                 "model": self.model,
                 "raw_response": response,
+                "cached": cached,
             },
         )
 
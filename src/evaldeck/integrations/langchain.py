@@ -5,7 +5,6 @@ Provides automatic instrumentation and trace capture for LangChain/LangGraph age
 
 from __future__ import annotations
 
-import threading
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
@@ -19,16 +18,14 @@ class LangChainIntegration:
     Automatically sets up OpenTelemetry tracing and provides a wrapper
     that invokes the agent and returns a Trace.
 
-    Thread-safe: uses thread-local storage to track traces per thread,
-    allowing parallel test execution.
+    Thread-safe: each invocation is scoped to its own OpenTelemetry trace,
+    allowing agents to run in parallel during test execution.
     """
 
     def __init__(self) -> None:
         self._processor: Any = None
         self._agent: Any = None
         self._initialized = False
-        self._lock = threading.Lock()
-        self._local = threading.local()
 
     def setup(self, agent_factory: Callable[[], Any]) -> None:
         """Set up instrumentation and create the agent.
@@ -63,8 +60,9 @@ class LangChainIntegration:
     def run(self, input: str, history: list[Message] | None = None) -> Trace:
         """Run the agent and return a trace.
 
-        Note: Agent invocations are serialized (one at a time) to ensure
-        clean trace capture. Evaluations (grading) can still run in parallel.
+        Safe to call concurrently: each call runs inside its own invocation
+        span, so the captured trace is looked up by ID rather than by diffing
+        the processor's trace list.
 
         Args:
             input: The input string to send to the agent.
@@ -76,30 +74,16 @@ class LangChainIntegration:
         if not self._initialized:
             raise RuntimeError("Integration not initialized. Call setup() first.")
 
-        # Serialize agent invocations to ensure clean trace capture
-        # (OTel trace IDs can get mixed when agents run truly in parallel)
-        with self._lock:
-            # Record traces before
-            traces_before = set(self._processor._traces.keys())
-
-            # Invoke the agent
+        # Scope the invocation to its own trace so parallel runs don't mix
+        with self._processor.invocation() as trace_id:
             self._invoke_agent(input, history)
 
-            # Find the new trace created by this invocation
-            traces_after = set(self._processor._traces.keys())
-            new_trace_ids = traces_after - traces_before
-
-            if not new_trace_ids:
-                raise RuntimeError("No trace captured from agent execution")
-
-            # Get the trace
-            trace_id = new_trace_ids.pop()
-            trace: Trace | None = self._processor.get_trace(trace_id)
+        trace: Trace | None = self._processor.get_trace(trace_id)
 
-            if trace is None:
-                raise RuntimeError("No trace captured from agent execution")
+        if trace is None:
+            raise RuntimeError("No trace captured from agent execution")
 
-            return trace
+        return trace
 
     def _invoke_agent(self, input: str, history: list[Message] | None = None) -> Any:
         """Invoke the agent with the appropriate format.
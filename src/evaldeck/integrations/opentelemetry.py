@@ -27,11 +27,22 @@ Usage:
     # Get the evaldeck trace and evaluate
     trace = processor.get_latest_trace()
     result = evaluator.evaluate(trace, test_case)
+
+Concurrent usage:
+    # Scope each invocation to its own trace so parallel runs don't mix
+    with processor.invocation() as trace_id:
+        agent.invoke({"input": "Book a flight to NYC"})
+
+    trace = processor.get_trace(trace_id)
 """
 
 from __future__ import annotations
 
 import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -64,6 +75,9 @@ SPAN_KIND_RERANKER = "RERANKER"
 SPAN_KIND_GUARDRAIL = "GUARDRAIL"
 SPAN_KIND_AGENT = "AGENT"
 
+# Attribute marking the wrapper span opened by EvaldeckSpanProcessor.invocation()
+INVOCATION_ATTRIBUTE = "evaldeck.invocation"
+
 
 class EvaldeckSpanProcessor(SpanProcessor):
     """OpenTelemetry SpanProcessor that builds Evaldeck Traces from OpenInference spans.
@@ -86,44 +100,63 @@ class EvaldeckSpanProcessor(SpanProcessor):
         evaldeck_trace = processor.get_latest_trace()
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_traces: int | None = 1000) -> None:
+        """Initialize the processor.
+
+        Args:
+            max_traces: Maximum number of traces to keep. Once exceeded, the
+                oldest trace is dropped, so long-running processes don't grow
+                without bound between reset() calls. None keeps every trace.
+        """
         if not OTEL_AVAILABLE:
             raise ImportError(
                 "OpenTelemetry is not installed. Install with: "
                 "pip install opentelemetry-sdk openinference-semantic-conventions"
             )
 
-        self._traces: dict[str, Trace] = {}
-        self._trace_order: list[str] = []  # Track order for get_latest_trace
+        if max_traces is not None and max_traces < 1:
+            raise ValueError(f"max_traces must be at least 1, got {max_traces}")
+
+        self.max_traces = max_traces
+        self._traces: OrderedDict[str, Trace] = OrderedDict()  # Insertion order
+        self._invocation_span_ids: set[int] = set()
+        self._lock = threading.Lock()
 
     def on_start(self, span: ReadableSpan, parent_context: Any = None) -> None:
-        """Called when a span starts. We don't need to do anything here."""
-        pass
+        """Called when a span starts. Records invocation wrapper spans."""
+        if span.attributes and span.attributes.get(INVOCATION_ATTRIBUTE):
+            self._invocation_span_ids.add(span.context.span_id)
 
     def on_end(self, span: ReadableSpan) -> None:
         """Called when a span ends. Convert to Evaldeck format."""
-        attrs = dict(span.attributes or {})
+        # Read attributes in place; most spans are skipped, so don't copy them
+        attrs: Mapping[str, Any] = span.attributes or {}
         span_kind = str(attrs.get("openinference.span.kind", "")).upper()
 
         # Skip spans without OpenInference kind
         if not span_kind:
+            if attrs.get(INVOCATION_ATTRIBUTE):
+                self._invocation_span_ids.discard(span.context.span_id)
             return
 
         trace_id = format(span.context.trace_id, "032x")
 
-        # Ensure trace exists
-        if trace_id not in self._traces:
-            self._traces[trace_id] = Trace(
-                id=trace_id,
-                input="",
-                framework="openinference",
-            )
-            self._trace_order.append(trace_id)
-
-        trace = self._traces[trace_id]
-
-        # CHAIN/AGENT spans with no parent become the root trace
-        if span_kind in (SPAN_KIND_CHAIN, SPAN_KIND_AGENT) and span.parent is None:
+        # Ensure trace exists (spans of one trace may end on different threads)
+        with self._lock:
+            trace = self._traces.get(trace_id)
+            if trace is None:
+                trace = Trace(
+                    id=trace_id,
+                    input="",
+                    framework="openinference",
+                )
+                self._traces[trace_id] = trace
+                if self.max_traces is not None and len(self._traces) > self.max_traces:
+                    self._traces.popitem(last=False)
+
+        # CHAIN/AGENT spans with no parent (or directly under an invocation
+        # wrapper span) become the root trace
+        if span_kind in (SPAN_KIND_CHAIN, SPAN_KIND_AGENT) and self._is_root(span):
             self._update_trace_from_root_span(trace, span, attrs)
             return
 
@@ -132,8 +165,13 @@ class EvaldeckSpanProcessor(SpanProcessor):
         if step:
             trace.add_step(step)
 
+    def _is_root(self, span: ReadableSpan) -> bool:
+        """Check if a span is the top-level span of an agent invocation."""
+        parent = span.parent
+        return parent is None or parent.span_id in self._invocation_span_ids
+
     def _update_trace_from_root_span(
-        self, trace: Trace, span: ReadableSpan, attrs: dict[str, Any]
+        self, trace: Trace, span: ReadableSpan, attrs: Mapping[str, Any]
     ) -> None:
         """Update trace metadata from the root CHAIN/AGENT span."""
         trace.input = str(attrs.get("input.value", trace.input or ""))
@@ -153,7 +191,7 @@ class EvaldeckSpanProcessor(SpanProcessor):
         trace.metadata["otel_trace_id"] = format(span.context.trace_id, "032x")
         trace.metadata["otel_root_span_id"] = format(span.context.span_id, "016x")
 
-    def _span_to_step(self, span: ReadableSpan, kind: str, attrs: dict[str, Any]) -> Step | None:
+    def _span_to_step(self, span: ReadableSpan, kind: str, attrs: Mapping[str, Any]) -> Step | None:
         """Convert an OpenTelemetry span to an Evaldeck Step."""
 
         if kind == SPAN_KIND_LLM:
@@ -174,7 +212,7 @@ class EvaldeckSpanProcessor(SpanProcessor):
 
         return None
 
-    def _convert_llm_span(self, span: ReadableSpan, attrs: dict[str, Any]) -> Step:
+    def _convert_llm_span(self, span: ReadableSpan, attrs: Mapping[str, Any]) -> Step:
         """Convert an LLM span to a Step."""
         return Step(
             type=StepType.LLM_CALL,
@@ -195,7 +233,7 @@ class EvaldeckSpanProcessor(SpanProcessor):
             },
         )
 
-    def _convert_tool_span(self, span: ReadableSpan, attrs: dict[str, Any]) -> Step:
+    def _convert_tool_span(self, span: ReadableSpan, attrs: Mapping[str, Any]) -> Step:
         """Convert a TOOL span to a Step."""
         tool_name = attrs.get("tool.name") or attrs.get("tool_call.function.name") or "unknown_tool"
 
@@ -219,7 +257,9 @@ class EvaldeckSpanProcessor(SpanProcessor):
             },
         )
 
-    def _convert_retrieval_span(self, span: ReadableSpan, kind: str, attrs: dict[str, Any]) -> Step:
+    def _convert_retrieval_span(
+        self, span: ReadableSpan, kind: str, attrs: Mapping[str, Any]
+    ) -> Step:
         """Convert EMBEDDING/RETRIEVER/RERANKER spans to tool call Steps."""
         return Step(
             type=StepType.TOOL_CALL,
@@ -235,7 +275,7 @@ class EvaldeckSpanProcessor(SpanProcessor):
             },
         )
 
-    def _convert_guardrail_span(self, span: ReadableSpan, attrs: dict[str, Any]) -> Step:
+    def _convert_guardrail_span(self, span: ReadableSpan, attrs: Mapping[str, Any]) -> Step:
         """Convert GUARDRAIL spans to reasoning Steps."""
         return Step(
             type=StepType.REASONING,
@@ -249,7 +289,7 @@ class EvaldeckSpanProcessor(SpanProcessor):
             },
         )
 
-    def _convert_chain_span(self, span: ReadableSpan, attrs: dict[str, Any]) -> Step:
+    def _convert_chain_span(self, span: ReadableSpan, attrs: Mapping[str, Any]) -> Step:
         """Convert nested CHAIN/AGENT spans to reasoning Steps."""
         return Step(
             type=StepType.REASONING,
@@ -262,7 +302,7 @@ class EvaldeckSpanProcessor(SpanProcessor):
             },
         )
 
-    def _extract_messages(self, attrs: dict[str, Any], direction: str) -> str:
+    def _extract_messages(self, attrs: Mapping[str, Any], direction: str) -> str:
         """Extract message content from OpenInference indexed attributes.
 
         OpenInference uses indexed prefixes like:
@@ -347,14 +387,36 @@ class EvaldeckSpanProcessor(SpanProcessor):
         """
         return self._traces.get(trace_id)
 
+    @contextmanager
+    def invocation(self, name: str = "evaldeck.invocation") -> Iterator[str]:
+        """Scope an agent invocation to its own trace.
+
+        Opens a wrapper span so every span created inside the block shares a
+        trace ID that is known up front. This lets several invocations run
+        concurrently (e.g. from different threads) without their traces
+        getting mixed up, unlike reset() + get_latest_trace().
+
+        Args:
+            name: Name of the wrapper span.
+
+        Yields:
+            The trace ID to pass to get_trace() once the block exits.
+        """
+        from opentelemetry import trace
+
+        tracer = trace.get_tracer(__name__)
+        with tracer.start_as_current_span(name, attributes={INVOCATION_ATTRIBUTE: True}) as span:
+            yield format(span.get_span_context().trace_id, "032x")
+
     def get_latest_trace(self) -> Trace | None:
         """Get the most recently completed trace.
 
         Returns:
             The most recent Evaldeck Trace, or None if no traces captured
         """
-        if self._trace_order:
-            return self._traces.get(self._trace_order[-1])
+        with self._lock:
+            if self._traces:
+                return next(reversed(self._traces.values()))
         return None
 
     def get_all_traces(self) -> list[Trace]:
@@ -363,12 +425,13 @@ class EvaldeckSpanProcessor(SpanProcessor):
         Returns:
             List of all Evaldeck Traces
         """
-        return [self._traces[tid] for tid in self._trace_order if tid in self._traces]
+        with self._lock:
+            return list(self._traces.values())
 
     def reset(self) -> None:
         """Clear all captured traces."""
-        self._traces.clear()
-        self._trace_order.clear()
+        with self._lock:
+            self._traces.clear()
 
     def shutdown(self) -> None:
         """Shutdown the processor (required by SpanProcessor interface)."""
@@ -379,7 +442,11 @@ class EvaldeckSpanProcessor(SpanProcessor):
         return True
 
 
-def setup_tracing(processor: EvaldeckSpanProcessor | None = None) -> EvaldeckSpanProcessor:
+def setup_tracing(
+    processor: EvaldeckSpanProcessor | None = None,
+    sample_rate: float = 1.0,
+    max_traces: int | None = 1000,
+) -> EvaldeckSpanProcessor:
     """Setup OpenTelemetry tracing with the Evaldeck processor.
 
     This is a convenience function that sets up the tracer provider
@@ -387,6 +454,13 @@ def setup_tracing(processor: EvaldeckSpanProcessor | None = None) -> EvaldeckSpa
 
     Args:
         processor: Optional existing processor. If None, creates a new one.
+        sample_rate: Fraction of traces to record (0.0-1.0). Below 1.0, a
+            parent-based ratio sampler is installed: unsampled traces are never
+            recorded, so their spans cost almost nothing and never reach the
+            processor. Keep the default of 1.0 when running evaluations, since
+            an unsampled agent run produces no trace to grade.
+        max_traces: Trace retention limit for a newly created processor.
+            Ignored when processor is given.
 
     Returns:
         The EvaldeckSpanProcessor (for later trace retrieval)
@@ -404,11 +478,18 @@ def setup_tracing(processor: EvaldeckSpanProcessor | None = None) -> EvaldeckSpa
     """
     from opentelemetry import trace
     from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError(f"sample_rate must be between 0.0 and 1.0, got {sample_rate}")
 
     if processor is None:
-        processor = EvaldeckSpanProcessor()
+        processor = EvaldeckSpanProcessor(max_traces=max_traces)
 
-    provider = TracerProvider()
+    if sample_rate < 1.0:
+        provider = TracerProvider(sampler=ParentBased(TraceIdRatioBased(sample_rate)))
+    else:
+        provider = TracerProvider()
     provider.add_span_processor(processor)
     trace.set_tracer_provider(provider)
 
@@ -21,12 +21,17 @@ class BaseMetric(ABC):
 
     Supports both sync and async calculation. Override calculate_async()
     for metrics that need to make async I/O calls (e.g., fetching external
-    benchmark data).
+    benchmark data). Set is_io_bound = False for cheap metrics so the
+    evaluator calls calculate() inline instead of in a thread pool.
     """
 
     name: str = "base"
     unit: str | None = None
 
+    # Whether calculating may block. Metrics computed purely from the trace in
+    # memory set this to False to skip the thread pool in async evaluation.
+    is_io_bound: bool = True
+
     @abstractmethod
     def calculate(self, trace: Trace, test_case: EvalCase | None = None) -> MetricResult:
         """Calculate the metric value (sync).
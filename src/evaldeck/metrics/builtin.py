@@ -16,6 +16,7 @@ class StepCountMetric(BaseMetric):
     """Count total number of steps in the trace."""
 
     name = "step_count"
+    is_io_bound = False
     unit = "steps"
 
     def calculate(self, trace: Trace, test_case: EvalCase | None = None) -> MetricResult:
@@ -30,6 +31,7 @@ class TokenUsageMetric(BaseMetric):
     """Total token usage across all LLM calls."""
 
     name = "token_usage"
+    is_io_bound = False
     unit = "tokens"
 
     def calculate(self, trace: Trace, test_case: EvalCase | None = None) -> MetricResult:
@@ -38,7 +40,7 @@ class TokenUsageMetric(BaseMetric):
             value=float(trace.total_tokens),
             unit=self.unit,
             details={
-                "llm_calls": len(trace.llm_calls),
+                "llm_calls": trace.llm_call_count,
             },
         )
 
@@ -47,12 +49,13 @@ class ToolCallCountMetric(BaseMetric):
     """Count number of tool calls."""
 
     name = "tool_call_count"
+    is_io_bound = False
     unit = "calls"
 
     def calculate(self, trace: Trace, test_case: EvalCase | None = None) -> MetricResult:
         return MetricResult(
             metric_name=self.name,
-            value=float(len(trace.tool_calls)),
+            value=float(trace.tool_call_count),
             unit=self.unit,
             details={
                 "tools": trace.tools_called,
@@ -64,6 +67,7 @@ class DurationMetric(BaseMetric):
     """Total execution duration."""
 
     name = "duration"
+    is_io_bound = False
     unit = "ms"
 
     def calculate(self, trace: Trace, test_case: EvalCase | None = None) -> MetricResult:
@@ -79,6 +83,7 @@ class ToolDiversityMetric(BaseMetric):
     """Measure diversity of tools used (unique tools / total calls)."""
 
     name = "tool_diversity"
+    is_io_bound = False
     unit = "ratio"
 
     def calculate(self, trace: Trace, test_case: EvalCase | None = None) -> MetricResult:
@@ -90,7 +95,7 @@ class ToolDiversityMetric(BaseMetric):
                 unit=self.unit,
             )
 
-        unique_tools = len(set(trace.tools_called))
+        unique_tools = len(trace.tools_called_set)
         total_calls = len(tool_calls)
         diversity = unique_tools / total_calls
 
@@ -112,6 +117,7 @@ class StepEfficiencyMetric(BaseMetric):
     """
 
     name = "step_efficiency"
+    is_io_bound = False
     unit = "ratio"
 
     def calculate(self, trace: Trace, test_case: EvalCase | None = None) -> MetricResult:
@@ -155,12 +161,13 @@ class LLMCallCountMetric(BaseMetric):
     """Count number of LLM calls."""
 
     name = "llm_call_count"
+    is_io_bound = False
     unit = "calls"
 
     def calculate(self, trace: Trace, test_case: EvalCase | None = None) -> MetricResult:
         return MetricResult(
             metric_name=self.name,
-            value=float(len(trace.llm_calls)),
+            value=float(trace.llm_call_count),
             unit=self.unit,
         )
 
@@ -169,6 +176,7 @@ class ErrorRateMetric(BaseMetric):
     """Calculate error rate across steps."""
 
     name = "error_rate"
+    is_io_bound = False
     unit = "ratio"
 
     def calculate(self, trace: Trace, test_case: EvalCase | None = None) -> MetricResult:
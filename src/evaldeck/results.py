@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Iterable
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -67,6 +69,11 @@ class GradeResult(BaseModel):
         """Create an error result."""
         return cls(grader_name=grader_name, status=GradeStatus.ERROR, message=message, **kwargs)
 
+    @classmethod
+    def skipped_result(cls, grader_name: str, message: str, **kwargs: Any) -> GradeResult:
+        """Create a skipped result."""
+        return cls(grader_name=grader_name, status=GradeStatus.SKIP, message=message, **kwargs)
+
 
 class MetricResult(BaseModel):
     """Result from a metric calculation."""
@@ -181,6 +188,11 @@ class EvaluationResult(BaseModel):
             if self.failed_at_turn is None:
                 self.failed_at_turn = turn_result.turn_index
 
+    def add_turn_results(self, turn_results: Iterable[TurnResult]) -> None:
+        """Add several turn results in order."""
+        for turn_result in turn_results:
+            self.add_turn_result(turn_result)
+
 
 class SuiteResult(BaseModel):
     """Result of evaluating a test suite."""
@@ -190,6 +202,13 @@ class SuiteResult(BaseModel):
     started_at: datetime = Field(default_factory=datetime.now)
     completed_at: datetime | None = None
 
+    def _status_counts(self) -> Counter[GradeStatus]:
+        """Count results by status.
+
+        Counted on every access, since results can change status after being added.
+        """
+        return Counter(r.status for r in self.results)
+
     @property
     def total(self) -> int:
         """Total number of test cases."""
@@ -198,17 +217,17 @@ class SuiteResult(BaseModel):
     @property
     def passed(self) -> int:
         """Number of passed test cases."""
-        return sum(1 for r in self.results if r.passed)
+        return self._status_counts()[GradeStatus.PASS]
 
     @property
     def failed(self) -> int:
         """Number of failed test cases."""
-        return sum(1 for r in self.results if r.status == GradeStatus.FAIL)
+        return self._status_counts()[GradeStatus.FAIL]
 
     @property
     def errors(self) -> int:
         """Number of errored test cases."""
-        return sum(1 for r in self.results if r.status == GradeStatus.ERROR)
+        return self._status_counts()[GradeStatus.ERROR]
 
     @property
     def pass_rate(self) -> float:
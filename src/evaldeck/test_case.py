@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 from pydantic import BaseModel, Field
 
+from evaldeck._yaml import SafeDumper, SafeLoader
+
+if TYPE_CHECKING:
+    from evaldeck.config import EvaldeckConfig
+
 
 class ExpectedBehavior(BaseModel):
     """Expected behavior for an agent test case."""
@@ -53,6 +58,9 @@ class GraderConfig(BaseModel):
     model: str | None = None
     threshold: float | None = None
 
+    # Skip this grader if any of the named graders fail (e.g. ["tool_called"])
+    skip_if_failed: list[str] | None = None
+
     # For custom graders
     module: str | None = None
     function: str | None = None
@@ -127,14 +135,13 @@ class EvalCase(BaseModel):
     @classmethod
     def from_yaml(cls, path: str | Path) -> EvalCase:
         """Load a test case from a YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(Path(path).read_bytes(), Loader=SafeLoader)
         return cls._from_dict(data)
 
     @classmethod
     def from_yaml_string(cls, content: str) -> EvalCase:
         """Load a test case from a YAML string."""
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=SafeLoader)
         return cls._from_dict(data)
 
     @classmethod
@@ -175,7 +182,9 @@ class EvalCase(BaseModel):
 
     def to_yaml(self) -> str:
         """Convert test case to YAML string."""
-        result: str = yaml.dump(self.model_dump(exclude_none=True), default_flow_style=False)
+        result: str = yaml.dump(
+            self.model_dump(exclude_none=True), Dumper=SafeDumper, default_flow_style=False
+        )
         return result
 
 
@@ -197,18 +206,13 @@ class EvalSuite(BaseModel):
         if not path.is_dir():
             raise ValueError(f"Path is not a directory: {path}")
 
-        test_cases = []
-        for file in sorted(path.glob("*.yaml")):
-            if file.name.startswith("_"):
-                continue
-            try:
-                test_cases.append(EvalCase.from_yaml(file))
-            except Exception as e:
-                raise ValueError(f"Failed to load {file}: {e}") from e
+        # One directory scan; .yaml files first, then .yml, each sorted by name
+        files = [f for f in path.iterdir() if not f.name.startswith("_")]
+        yaml_files = sorted(f for f in files if f.suffix == ".yaml")
+        yaml_files += sorted(f for f in files if f.suffix == ".yml")
 
-        for file in sorted(path.glob("*.yml")):
-            if file.name.startswith("_"):
-                continue
+        test_cases = []
+        for file in yaml_files:
             try:
                 test_cases.append(EvalCase.from_yaml(file))
             except Exception as e:
@@ -221,7 +225,8 @@ class EvalSuite(BaseModel):
 
     def filter_by_tags(self, tags: list[str]) -> EvalSuite:
         """Return a new suite with only test cases matching the given tags."""
-        filtered = [tc for tc in self.test_cases if any(t in tc.tags for t in tags)]
+        wanted = frozenset(tags)
+        filtered = [tc for tc in self.test_cases if not wanted.isdisjoint(tc.tags)]
         return EvalSuite(
             name=self.name,
             description=self.description,
@@ -229,3 +234,34 @@ class EvalSuite(BaseModel):
             defaults=self.defaults,
             tags=self.tags,
         )
+
+
+def discover_suites(config: EvaldeckConfig) -> list[EvalSuite]:
+    """Discover test suites from configuration.
+
+    Uses the configured suites if any, otherwise treats each subdirectory of
+    test_dir as a suite (or test_dir itself if it has no subdirectories).
+    """
+    suites = []
+
+    # Use configured suites
+    if config.suites:
+        for suite_config in config.suites:
+            path = Path(suite_config.path)
+            if path.is_dir():
+                suites.append(EvalSuite.from_directory(path, name=suite_config.name))
+
+    # Or discover from test_dir
+    else:
+        test_dir = Path(config.test_dir)
+        if test_dir.is_dir():
+            # Check for subdirectories (each is a suite)
+            subdirs = [d for d in test_dir.iterdir() if d.is_dir()]
+            if subdirs:
+                for subdir in subdirs:
+                    suites.append(EvalSuite.from_directory(subdir))
+            else:
+                # Single suite from test_dir
+                suites.append(EvalSuite.from_directory(test_dir, name="default"))
+
+    return suites
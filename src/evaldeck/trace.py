@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import sys
+import time
+import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+def _short_id() -> str:
+    """Generate a short random ID (first 8 hex digits of a UUID4)."""
+    return uuid.uuid4().hex[:8]
 
 
 class StepType(str, Enum):
@@ -89,9 +97,7 @@ class Step(BaseModel):
     def model_post_init(self, __context: Any) -> None:
         """Generate ID if not provided."""
         if not self.id:
-            import uuid
-
-            self.id = str(uuid.uuid4())[:8]
+            self.id = _short_id()
 
     @classmethod
     def llm_call(
@@ -139,12 +145,55 @@ class Step(BaseModel):
         )
 
 
+class _StepIndex(NamedTuple):
+    """Per-type views of a trace's steps, built in a single pass."""
+
+    steps: list[Step]
+    size: int
+    tool_calls: list[Step]
+    llm_calls: list[Step]
+    tools_called: list[str]
+    tool_set: frozenset[str]
+    total_tokens: int
+
+    @classmethod
+    def build(cls, steps: list[Step]) -> _StepIndex:
+        tool_calls: list[Step] = []
+        llm_calls: list[Step] = []
+        tools_called: list[str] = []
+        total_tokens = 0
+        for step in steps:
+            if step.type == StepType.TOOL_CALL:
+                tool_calls.append(step)
+                if step.tool_name:
+                    # Interned so set lookups against expected names compare by identity
+                    tools_called.append(sys.intern(step.tool_name))
+            elif step.type == StepType.LLM_CALL:
+                llm_calls.append(step)
+                if step.tokens:
+                    total_tokens += step.tokens.total_tokens
+        return cls(
+            steps,
+            len(steps),
+            tool_calls,
+            llm_calls,
+            tools_called,
+            frozenset(tools_called),
+            total_tokens,
+        )
+
+
 class Trace(BaseModel):
     """Complete execution trace of an agent.
 
     A trace captures everything that happened during an agent's execution,
     from the initial input to the final output, including all intermediate
     steps (LLM calls, tool calls, reasoning).
+
+    Step-derived properties (tool_calls, tools_called, total_tokens, ...) are
+    cached. They follow added steps and a reassigned steps list, but not
+    in-place edits to a step already in the trace, so finish a step before
+    adding it (or assign a new steps list after editing).
     """
 
     id: str = Field(default_factory=lambda: "")
@@ -163,36 +212,83 @@ class Trace(BaseModel):
     framework: str | None = None
     agent_name: str | None = None
 
+    # Cached per-type step views, shared by all graders and metrics
+    _index: _StepIndex | None = PrivateAttr(default=None)
+    # (started_at, monotonic start time), set only when the trace starts now (not when loaded)
+    _started: tuple[datetime, int] | None = PrivateAttr(default=None)
+    # (output it was computed from, casefolded output), shared by case-insensitive graders
+    _folded: tuple[str, str] | None = PrivateAttr(default=None)
+
     def model_post_init(self, __context: Any) -> None:
         """Generate ID if not provided."""
         if not self.id:
-            import uuid
-
-            self.id = str(uuid.uuid4())[:8]
+            self.id = _short_id()
+        if "started_at" not in self.model_fields_set:
+            self._started = (self.started_at, time.monotonic_ns())
+
+    def _step_index(self) -> _StepIndex:
+        """Get the step index, rebuilding it if steps changed since last use.
+
+        add_step() drops the index, and appending steps or assigning a new
+        steps list is detected. Editing existing entries in place is not, so
+        steps should be complete when added.
+        """
+        # Read straight from the private dict, skipping pydantic's slow __getattr__
+        index: _StepIndex | None = self.__pydantic_private__["_index"]  # type: ignore[index]
+        if index is None or index.steps is not self.steps or index.size != len(self.steps):
+            index = _StepIndex.build(self.steps)
+            self._index = index
+        return index
 
     @property
     def tool_calls(self) -> list[Step]:
         """Get all tool call steps."""
-        return [s for s in self.steps if s.type == StepType.TOOL_CALL]
+        return list(self._step_index().tool_calls)
 
     @property
     def llm_calls(self) -> list[Step]:
         """Get all LLM call steps."""
-        return [s for s in self.steps if s.type == StepType.LLM_CALL]
+        return list(self._step_index().llm_calls)
+
+    @property
+    def tool_call_count(self) -> int:
+        """Get the number of tool call steps."""
+        return len(self._step_index().tool_calls)
+
+    @property
+    def llm_call_count(self) -> int:
+        """Get the number of LLM call steps."""
+        return len(self._step_index().llm_calls)
 
     @property
     def tools_called(self) -> list[str]:
         """Get list of tool names that were called."""
-        return [s.tool_name for s in self.tool_calls if s.tool_name]
+        return list(self._step_index().tools_called)
+
+    @property
+    def tools_called_set(self) -> frozenset[str]:
+        """Get the distinct tool names that were called."""
+        return self._step_index().tool_set
+
+    @property
+    def output_casefolded(self) -> str:
+        """Get the output casefolded for case-insensitive matching ("" if unset).
+
+        Computed once and reused until output is reassigned.
+        """
+        output = self.output or ""
+        # Going through pydantic's __getattr__ would cost more than casefolding
+        # a short output, so read the private dict directly
+        folded: tuple[str, str] | None = self.__pydantic_private__["_folded"]  # type: ignore[index]
+        if folded is None or folded[0] is not output:
+            folded = (output, output.casefold())
+            self._folded = folded
+        return folded[1]
 
     @property
     def total_tokens(self) -> int:
         """Get total tokens used across all LLM calls."""
-        total = 0
-        for step in self.llm_calls:
-            if step.tokens:
-                total += step.tokens.total_tokens
-        return total
+        return self._step_index().total_tokens
 
     @property
     def step_count(self) -> int:
@@ -202,13 +298,19 @@ class Trace(BaseModel):
     def add_step(self, step: Step) -> None:
         """Add a step to the trace."""
         self.steps.append(step)
+        # Rebuild step views on next use, even if steps was edited in place too
+        self._index = None
 
     def complete(self, output: str, status: TraceStatus = TraceStatus.SUCCESS) -> None:
         """Mark the trace as complete."""
         self.output = output
         self.status = status
         self.completed_at = datetime.now()
-        if self.started_at:
+        started = self._started
+        if started is not None and started[0] == self.started_at:
+            # Immune to wall-clock adjustments during the run
+            self.duration_ms = (time.monotonic_ns() - started[1]) / 1_000_000
+        elif self.started_at:
             delta = self.completed_at - self.started_at
             self.duration_ms = delta.total_seconds() * 1000
 
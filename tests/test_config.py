@@ -0,0 +1,59 @@
+"""Tests for config module."""
+
+import os
+from pathlib import Path
+
+from evaldeck.config import EvaldeckConfig, _load_file_cached
+
+
+class TestConfigLoading:
+    """Tests for loading EvaldeckConfig from files."""
+
+    def test_reload_reuses_parse(self, tmp_path: Path) -> None:
+        """Test that an unchanged file is parsed once and returned as a copy."""
+        path = tmp_path / "evaldeck.yaml"
+        path.write_text("test_dir: evals\n")
+        EvaldeckConfig.invalidate_cache()
+
+        first = EvaldeckConfig.load(path)
+        first.test_dir = "changed"
+        second = EvaldeckConfig.load(path)
+
+        assert second.test_dir == "evals"
+        assert _load_file_cached.cache_info().hits == 1
+
+    def test_edit_invalidates_cache(self, tmp_path: Path) -> None:
+        """Test that changing the file is picked up on the next load."""
+        path = tmp_path / "evaldeck.yaml"
+        path.write_text("test_dir: evals\n")
+        assert EvaldeckConfig.load(path).test_dir == "evals"
+
+        path.write_text("test_dir: other_evals\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert EvaldeckConfig.load(path).test_dir == "other_evals"
+
+    def test_nested_sections(self, tmp_path: Path) -> None:
+        """Test that nested sections and the graders.llm shorthand are parsed."""
+        path = tmp_path / "evaldeck.yaml"
+        path.write_text(
+            "agent:\n"
+            "  module: my_agent\n"
+            "graders:\n"
+            "  timeout: 10\n"
+            "  llm:\n"
+            "    model: claude-3-haiku-20240307\n"
+            "    cache: memory\n"
+            "suites:\n"
+            "  - name: core\n"
+            "    path: tests/evals/core\n"
+        )
+
+        config = EvaldeckConfig.load(path)
+
+        assert config.agent.module == "my_agent"
+        assert config.graders.llm_model == "claude-3-haiku-20240307"
+        assert config.graders.llm_cache == "memory"
+        assert config.graders.timeout == 10
+        assert config.suites[0].name == "core"
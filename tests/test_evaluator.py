@@ -1,6 +1,7 @@
 """Tests for evaluator module."""
 
 import asyncio
+import sys
 import time
 
 import pytest
@@ -83,6 +84,39 @@ class TestEvaluator:
         assert "tool_called" in grader_names
         assert "max_steps" in grader_names
 
+    def test_expected_graders_shared_between_cases(self) -> None:
+        """Test that cases setting the same expected fields reuse grader instances."""
+        evaluator = Evaluator()
+        first = ExpectedBehavior(output_contains=["a"], max_steps=3)
+        second = ExpectedBehavior(output_contains=["b"], max_steps=5)
+        other = ExpectedBehavior(output_contains=["a"])
+
+        graders = evaluator._build_graders_for_turn(first, [])
+        assert [g.name for g in graders] == ["contains", "max_steps"]
+        assert all(
+            a is b
+            for a, b in zip(graders, evaluator._build_graders_for_turn(second, []), strict=True)
+        )
+        assert [g.name for g in evaluator._build_graders_for_turn(other, [])] == ["contains"]
+
+        # Callers get their own list, so appending doesn't leak into the cache
+        graders.append(graders[0])
+        assert len(evaluator._build_graders_for_turn(first, [])) == 2
+
+    def test_graders_from_config(self) -> None:
+        """Test that grader configs map to graders by case-insensitive type."""
+        from evaldeck.test_case import GraderConfig
+
+        evaluator = Evaluator()
+        configs = [
+            GraderConfig(type="Contains", params={"values": ["x"]}),
+            GraderConfig(type="tool_called", params={"required": ["search"]}),
+            GraderConfig(type="unknown"),
+        ]
+
+        graders = evaluator._build_graders_for_turn(None, configs)
+        assert [g.name for g in graders] == ["contains", "tool_called"]
+
     def test_custom_graders(self) -> None:
         """Test using custom graders."""
         from evaldeck.graders import ContainsGrader
@@ -154,6 +188,61 @@ class TestEvaluatorEdgeCases:
         assert not result.passed
 
 
+class TestGraderPrerequisites:
+    """Tests for skipping graders whose prerequisites failed."""
+
+    def _graders(self, calls: list[str]) -> list:
+        from evaldeck.graders import BaseGrader, ToolCalledGrader
+
+        class CountingGrader(BaseGrader):
+            name = "expensive"
+            skip_if_failed = ["tool_called"]
+
+            def grade(self, trace, test_case):
+                calls.append("grade")
+                return GradeResult.passed_result(self.name, "ran")
+
+        # Listed first to check that prerequisites run before it regardless of order
+        return [CountingGrader(), ToolCalledGrader(required=["search"])]
+
+    def test_skipped_when_prerequisite_fails(self) -> None:
+        """Test that a grader is skipped when a listed prerequisite fails."""
+        calls: list[str] = []
+        trace = Trace(input="test", output="result")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+
+        result = Evaluator(graders=self._graders(calls)).evaluate(trace, test_case)
+
+        assert calls == []
+        skipped = [g for g in result.grades if g.grader_name == "expensive"]
+        assert skipped[0].status == GradeStatus.SKIP
+        assert result.status == GradeStatus.FAIL
+
+    def test_runs_when_prerequisite_passes(self) -> None:
+        """Test that a grader runs normally once its prerequisites pass."""
+        calls: list[str] = []
+        trace = Trace(input="test", output="result")
+        trace.add_step(Step.tool_call(tool_name="search", tool_args={}))
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+
+        result = Evaluator(graders=self._graders(calls)).evaluate(trace, test_case)
+
+        assert calls == ["grade"]
+        assert result.passed
+
+    @pytest.mark.asyncio
+    async def test_skipped_async(self) -> None:
+        """Test that evaluate_async applies the same prerequisites."""
+        calls: list[str] = []
+        trace = Trace(input="test", output="result")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+
+        result = await Evaluator(graders=self._graders(calls)).evaluate_async(trace, test_case)
+
+        assert calls == []
+        assert any(g.status == GradeStatus.SKIP for g in result.grades)
+
+
 class TestAsyncGraders:
     """Tests for async grader execution."""
 
@@ -202,6 +291,38 @@ class TestAsyncGraders:
         # Should complete in ~0.05s (concurrent), not ~0.15s (sequential)
         assert total_time < 0.1  # Allow some margin
 
+    @pytest.mark.asyncio
+    async def test_grader_concurrency_limits_in_flight_graders(self) -> None:
+        """Test that grader_concurrency caps how many graders run at once."""
+        from evaldeck.graders import BaseGrader
+
+        active = 0
+        max_seen = 0
+
+        class SlowGrader(BaseGrader):
+            def __init__(self, grader_id: int):
+                self.name = f"slow_{grader_id}"
+
+            def grade(self, trace, test_case):
+                return GradeResult.passed_result(self.name, "passed")
+
+            async def grade_async(self, trace, test_case):
+                nonlocal active, max_seen
+                active += 1
+                max_seen = max(max_seen, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return GradeResult.passed_result(self.name, "passed")
+
+        evaluator = Evaluator(graders=[SlowGrader(i) for i in range(6)], grader_concurrency=2)
+        trace = Trace(input="test", output="result")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+
+        result = await evaluator.evaluate_async(trace, test_case)
+
+        assert len(result.grades) == 6
+        assert max_seen == 2
+
     @pytest.mark.asyncio
     async def test_base_grader_grade_async_wraps_sync(self) -> None:
         """Test that BaseGrader.grade_async wraps sync grade() by default."""
@@ -215,6 +336,86 @@ class TestAsyncGraders:
         result = await grader.grade_async(trace, test_case)
         assert result.passed
 
+    @pytest.mark.asyncio
+    async def test_cheap_grader_grade_async_skips_thread_pool(self) -> None:
+        """Test that grade_async calls grade() directly when is_io_bound is False."""
+        import threading
+
+        from evaldeck.graders import BaseGrader
+
+        threads: list[int] = []
+
+        class CheapGrader(BaseGrader):
+            name = "cheap"
+            is_io_bound = False
+
+            def grade(self, trace, test_case):
+                threads.append(threading.get_ident())
+                return GradeResult.passed_result(self.name, "passed")
+
+        trace = Trace(input="test", output="result")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+
+        result = await CheapGrader().grade_async(trace, test_case)
+
+        assert result.passed
+        assert threads == [threading.get_ident()]
+
+    @pytest.mark.asyncio
+    async def test_cpu_bound_graders_run_inline(self) -> None:
+        """Test that graders with is_io_bound = False skip the thread pool."""
+        import threading
+
+        from evaldeck.graders import BaseGrader
+
+        threads: dict[str, int] = {}
+
+        class ThreadRecordingGrader(BaseGrader):
+            def __init__(self, name: str, is_io_bound: bool):
+                self.name = name
+                self.is_io_bound = is_io_bound
+
+            def grade(self, trace, test_case):
+                threads[self.name] = threading.get_ident()
+                return GradeResult.passed_result(self.name, "passed")
+
+        graders = [
+            ThreadRecordingGrader("io", is_io_bound=True),
+            ThreadRecordingGrader("cpu", is_io_bound=False),
+        ]
+        trace = Trace(input="test", output="result")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+
+        result = await Evaluator(graders=graders).evaluate_async(trace, test_case)
+
+        assert [g.grader_name for g in result.grades] == ["io", "cpu"]
+        assert threads["cpu"] == threading.get_ident()
+        assert threads["io"] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_evaluate_async_metrics_keep_order(self) -> None:
+        """Test that inline and I/O-bound metrics are reported in the configured order."""
+        from evaldeck.metrics import BaseMetric, StepCountMetric, ToolCallCountMetric
+        from evaldeck.results import MetricResult
+
+        class RemoteMetric(BaseMetric):
+            name = "remote"
+
+            def calculate(self, trace, test_case=None):
+                return MetricResult(metric_name=self.name, value=1.0)
+
+        metrics = [StepCountMetric(), RemoteMetric(), ToolCallCountMetric()]
+        trace = Trace(input="test", output="result")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+
+        result = await Evaluator(metrics=metrics).evaluate_async(trace, test_case)
+
+        assert [m.metric_name for m in result.metrics] == [
+            "step_count",
+            "remote",
+            "tool_call_count",
+        ]
+
     @pytest.mark.asyncio
     async def test_composite_grader_async_runs_concurrently(self) -> None:
         """Test that CompositeGrader.grade_async runs sub-graders concurrently."""
@@ -304,6 +505,24 @@ class TestConcurrentExecution:
         assert result.total == 2
         assert result.passed == 2
 
+    @pytest.mark.asyncio
+    async def test_async_callable_object_agent(self) -> None:
+        """Test that an object with an async __call__ is awaited, not threaded."""
+        from evaldeck.trace import Message
+
+        class Agent:
+            async def __call__(self, input: str, history: list[Message] | None = None) -> Trace:
+                return Trace(input=input, output=f"Response to: {input}")
+
+        suite = EvalSuite(
+            name="test_suite",
+            test_cases=[EvalCase(name="test1", turns=[Turn(user="hello")])],
+        )
+
+        result = await Evaluator().evaluate_suite_async(suite, Agent())
+
+        assert result.passed == 1
+
     @pytest.mark.asyncio
     async def test_concurrent_execution_faster_than_sequential(self) -> None:
         """Test that concurrent execution is faster than sequential."""
@@ -363,6 +582,144 @@ class TestConcurrentExecution:
         # Should never exceed 3 concurrent
         assert max_seen <= 3
 
+    @pytest.mark.asyncio
+    async def test_sync_agent_runs_on_dedicated_threads(self) -> None:
+        """Test that with max_concurrent set, sync agents run on their own thread pool."""
+        import threading
+
+        from evaldeck.trace import Message
+
+        thread_names: set[str] = set()
+
+        def sync_agent(input: str, history: list[Message] | None = None) -> Trace:
+            thread_names.add(threading.current_thread().name)
+            return Trace(input=input, output="done")
+
+        suite = EvalSuite(
+            name="test_suite",
+            test_cases=[
+                EvalCase(name=f"test{i}", turns=[Turn(user=f"input{i}")]) for i in range(4)
+            ],
+        )
+
+        result = await Evaluator().evaluate_suite_async(suite, sync_agent, max_concurrent=2)
+
+        assert result.passed == 4
+        assert thread_names
+        assert all(name.startswith("evaldeck-agent") for name in thread_names)
+
+    @pytest.mark.asyncio
+    async def test_agent_retried_on_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a failing agent is retried up to the test case's retries."""
+        from evaldeck import evaluator as evaluator_module
+        from evaldeck.trace import Message
+
+        monkeypatch.setattr(evaluator_module, "_RETRY_BASE_DELAY", 0.0)
+        attempts: dict[str, int] = {}
+
+        async def flaky_agent(input: str, history: list[Message] | None = None) -> Trace:
+            attempts[input] = attempts.get(input, 0) + 1
+            if attempts[input] < 3:
+                raise RuntimeError("rate limited")
+            return Trace(input=input, output="done")
+
+        suite = EvalSuite(
+            name="test_suite",
+            test_cases=[
+                EvalCase(name="retried", turns=[Turn(user="a")], retries=2),
+                EvalCase(name="no_retries", turns=[Turn(user="b")]),
+            ],
+        )
+
+        result = await Evaluator().evaluate_suite_async(suite, flaky_agent)
+
+        assert attempts == {"a": 3, "b": 1}
+        assert result.results[0].passed
+        assert result.results[1].status == GradeStatus.ERROR
+
+    @pytest.mark.asyncio
+    async def test_agent_cannot_modify_history(self) -> None:
+        """Test that each turn sees only the real conversation, whatever the agent does."""
+        from evaldeck.trace import Message
+
+        seen: list[list[Message]] = []
+
+        async def agent(input: str, history: list[Message]) -> Trace:
+            seen.append(history)
+            history.append(Message(role="user", content="injected"))
+            return Trace(input=input, output=f"re: {input}")
+
+        test_case = EvalCase(name="conversation", turns=[Turn(user="a"), Turn(user="b")])
+        suite = EvalSuite(name="test_suite", test_cases=[test_case])
+
+        await Evaluator().evaluate_suite_async(suite, agent)
+
+        assert [m.content for m in seen[0]] == ["injected"]
+        assert [m.content for m in seen[1]] == ["a", "re: a", "injected"]
+
+    @pytest.mark.asyncio
+    async def test_remaining_turns_skipped_after_failure(self) -> None:
+        """Test that turns after a failing turn are recorded as skipped."""
+        from evaldeck.trace import Message
+
+        async def agent(input: str, history: list[Message] | None = None) -> Trace:
+            return Trace(input=input, output="nope")
+
+        test_case = EvalCase(
+            name="conversation",
+            turns=[
+                Turn(user="first"),
+                Turn(user="second", expected=ExpectedBehavior(output_contains=["yes"])),
+                Turn(user="third"),
+                Turn(user="fourth"),
+            ],
+        )
+        suite = EvalSuite(name="test_suite", test_cases=[test_case])
+
+        result = await Evaluator().evaluate_suite_async(suite, agent)
+
+        evaluation = result.results[0]
+        assert evaluation.status == GradeStatus.FAIL
+        assert evaluation.failed_at_turn == 1
+        assert [t.status for t in evaluation.turn_results] == [
+            GradeStatus.PASS,
+            GradeStatus.FAIL,
+            GradeStatus.SKIP,
+            GradeStatus.SKIP,
+        ]
+        assert [t.user_input for t in evaluation.turn_results[2:]] == ["third", "fourth"]
+        assert evaluation.turns_completed == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_callback_reported_as_error(self) -> None:
+        """Test that a test case whose on_result callback raises becomes an error."""
+        from evaldeck.trace import Message
+
+        async def agent(input: str, history: list[Message] | None = None) -> Trace:
+            return Trace(input=input, output="done")
+
+        def on_result(result) -> None:
+            if result.test_case_name == "test1":
+                raise RuntimeError("callback failed")
+
+        suite = EvalSuite(
+            name="test_suite",
+            test_cases=[
+                EvalCase(name=f"test{i}", turns=[Turn(user=f"input{i}")]) for i in range(3)
+            ],
+        )
+
+        result = await Evaluator().evaluate_suite_async(
+            suite, agent, on_result=on_result, max_concurrent=2
+        )
+
+        assert [r.test_case_name for r in result.results] == ["test0", "test1", "test2"]
+        assert [r.status for r in result.results] == [
+            GradeStatus.PASS,
+            GradeStatus.ERROR,
+            GradeStatus.PASS,
+        ]
+
     @pytest.mark.asyncio
     async def test_results_preserve_original_order(self) -> None:
         """Test that results maintain original test case order."""
@@ -417,6 +774,32 @@ class TestConcurrentExecution:
         assert len(results_received) == 3
         assert set(results_received) == {"test1", "test2", "test3"}
 
+    @pytest.mark.asyncio
+    async def test_async_on_result_callback_awaited(self) -> None:
+        """Test that an async on_result callback is awaited for each test."""
+        from evaldeck.trace import Message
+
+        results_received: list[str] = []
+
+        async def on_result(result) -> None:
+            await asyncio.sleep(0)
+            results_received.append(result.test_case_name)
+
+        async def agent(input: str, history: list[Message] | None = None) -> Trace:
+            return Trace(input=input, output="done")
+
+        suite = EvalSuite(
+            name="test_suite",
+            test_cases=[
+                EvalCase(name="test1", turns=[Turn(user="a")]),
+                EvalCase(name="test2", turns=[Turn(user="b")]),
+            ],
+        )
+
+        await Evaluator().evaluate_suite_async(suite, agent, on_result=on_result)
+
+        assert sorted(results_received) == ["test1", "test2"]
+
     @pytest.mark.asyncio
     async def test_error_in_one_test_doesnt_affect_others(self) -> None:
         """Test that an error in one test doesn't stop others."""
@@ -448,3 +831,180 @@ class TestConcurrentExecution:
         assert error_result.status == GradeStatus.ERROR
         # Error message is in the grade message for multi-turn evaluation
         assert any("Intentional failure" in g.message for g in error_result.grades if g.message)
+
+
+class TestEvaluationRunner:
+    """Tests for EvaluationRunner."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="asyncio.Runner needs Python 3.11")
+    def test_run_reuses_event_loop_until_closed(self) -> None:
+        """Test that repeated run() calls share one event loop until close()."""
+        from evaldeck import EvaldeckConfig
+        from evaldeck.evaluator import EvaluationRunner
+        from evaldeck.trace import Message
+
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        async def agent(input: str, history: list[Message] | None = None) -> Trace:
+            loops.append(asyncio.get_running_loop())
+            return Trace(input=input, output="done")
+
+        suite = EvalSuite(name="suite", test_cases=[EvalCase(name="a", turns=[Turn(user="a")])])
+
+        with EvaluationRunner(config=EvaldeckConfig()) as runner:
+            runner.run(suites=[suite], agent_func=agent)
+            runner.run(suites=[suite], agent_func=agent)
+
+        assert loops[0] is loops[1]
+        assert loops[0].is_closed()
+
+    async def test_grader_concurrency_shared_across_suites(self) -> None:
+        """Test that grader_concurrency bounds grader calls across the whole run."""
+        from evaldeck import EvaldeckConfig
+        from evaldeck.evaluator import EvaluationRunner
+        from evaldeck.graders import BaseGrader
+        from evaldeck.trace import Message
+
+        active = 0
+        peak = 0
+
+        class SlowGrader(BaseGrader):
+            name = "slow"
+
+            def grade(self, trace, test_case):
+                raise NotImplementedError
+
+            async def grade_async(self, trace, test_case):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return GradeResult.passed_result(self.name, "passed")
+
+        async def agent(input: str, history: list[Message] | None = None) -> Trace:
+            return Trace(input=input, output="done")
+
+        suites = [
+            EvalSuite(
+                name=name,
+                test_cases=[EvalCase(name=f"{name}{i}", turns=[Turn(user="hi")]) for i in range(3)],
+            )
+            for name in ("a", "b")
+        ]
+        runner = EvaluationRunner(config=EvaldeckConfig())
+        runner.evaluator.grader_concurrency = 2
+        runner.evaluator._build_graders_for_turn = lambda expected, configs: [  # type: ignore[method-assign]
+            SlowGrader()
+        ]
+
+        result = await runner.run_async(suites=suites, agent_func=agent, max_concurrent=0)
+
+        assert result.passed == 6
+        assert peak == 2
+
+    async def test_suites_run_concurrently_within_shared_limit(self) -> None:
+        """Test that suites overlap while max_concurrent bounds the whole run."""
+        from evaldeck import EvaldeckConfig
+        from evaldeck.evaluator import EvaluationRunner
+        from evaldeck.trace import Message
+
+        active = 0
+        peak = 0
+
+        async def agent(input: str, history: list[Message] | None = None) -> Trace:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return Trace(input=input, output="done")
+
+        suites = [
+            EvalSuite(
+                name=name,
+                test_cases=[EvalCase(name=f"{name}{i}", turns=[Turn(user="hi")]) for i in range(2)],
+            )
+            for name in ("a", "b")
+        ]
+
+        runner = EvaluationRunner(config=EvaldeckConfig())
+        result = await runner.run_async(suites=suites, agent_func=agent, max_concurrent=3)
+
+        # Each suite has only two cases, so reaching three means they overlapped
+        assert peak == 3
+        assert [s.suite_name for s in result.suites] == ["a", "b"]
+        assert result.total == 4
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="asyncio.Runner needs Python 3.11")
+    def test_close_closes_llm_clients(self) -> None:
+        """Test that close() closes async LLM clients opened on the kept loop."""
+        from evaldeck import EvaldeckConfig
+        from evaldeck.evaluator import EvaluationRunner
+        from evaldeck.graders.llm import _shared_async_client
+        from evaldeck.trace import Message
+
+        class FakeClient:
+            def __init__(self, api_key: str) -> None:
+                self.closed = False
+
+            async def close(self) -> None:
+                self.closed = True
+
+        clients: list[FakeClient] = []
+
+        async def agent(input: str, history: list[Message] | None = None) -> Trace:
+            clients.append(_shared_async_client(FakeClient, "key"))
+            return Trace(input=input, output="done")
+
+        suite = EvalSuite(name="suite", test_cases=[EvalCase(name="a", turns=[Turn(user="a")])])
+
+        with EvaluationRunner(config=EvaldeckConfig()) as runner:
+            runner.run(suites=[suite], agent_func=agent)
+            assert not clients[0].closed
+
+        assert clients[0].closed
+
+    def test_evaluate_suite_closes_llm_clients(self) -> None:
+        """Test that the sync evaluate_suite() closes LLM clients before its loop ends."""
+        from evaldeck.graders.llm import _shared_async_client
+        from evaldeck.trace import Message
+
+        class FakeClient:
+            def __init__(self, api_key: str) -> None:
+                self.closed = False
+
+            async def close(self) -> None:
+                self.closed = True
+
+        clients: list[FakeClient] = []
+
+        async def agent(input: str, history: list[Message] | None = None) -> Trace:
+            clients.append(_shared_async_client(FakeClient, "key"))
+            return Trace(input=input, output="done")
+
+        suite = EvalSuite(name="suite", test_cases=[EvalCase(name="a", turns=[Turn(user="a")])])
+        Evaluator().evaluate_suite(suite, agent)
+
+        assert clients[0].closed
+
+    def test_close_closes_sqlite_llm_cache(self, tmp_path) -> None:
+        """Test that close() closes the SQLite response cache opened from config."""
+        import sqlite3
+
+        from evaldeck import EvaldeckConfig
+        from evaldeck.config import GraderDefaults
+        from evaldeck.evaluator import EvaluationRunner
+        from evaldeck.graders import SQLiteLLMCache
+
+        config = EvaldeckConfig(
+            graders=GraderDefaults(llm_cache="sqlite", llm_cache_path=str(tmp_path / "c.db"))
+        )
+        runner = EvaluationRunner(config=config)
+        cache = runner.evaluator.llm_cache
+        assert isinstance(cache, SQLiteLLMCache)
+
+        runner.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get("key")
@@ -1,14 +1,25 @@
 """Tests for graders module."""
 
+import asyncio
+from pathlib import Path
+
 from evaldeck import EvalCase, ExpectedBehavior, Step, Trace, Turn
 from evaldeck.graders import (
     CompositeGrader,
     ContainsGrader,
+    CustomGrader,
+    EqualsGrader,
+    LLMGrader,
     MaxStepsGrader,
+    MemoryLLMCache,
+    RegexGrader,
+    SQLiteLLMCache,
     ToolCalledGrader,
     ToolNotCalledGrader,
+    ToolOrderGrader,
 )
-from evaldeck.results import GradeStatus
+from evaldeck.graders.llm import _shared_async_client, _shared_client, aclose_async_clients
+from evaldeck.results import GradeResult, GradeStatus
 
 
 class TestContainsGrader:
@@ -56,6 +67,17 @@ class TestContainsGrader:
 
         assert result.status == GradeStatus.PASS
 
+    def test_many_values_scanned_together(self) -> None:
+        """Test that long value lists report exactly the missing values."""
+        trace = Trace(input="test", output="Alpha beta GAMMA delta epsilon zeta eta theta")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        values = ["alpha", "beta", "gamma", "delta", "iota", "zeta", "eta", "theta", "kappa", ""]
+
+        result = ContainsGrader(values=values).grade(trace, test_case)
+
+        assert result.status == GradeStatus.FAIL
+        assert result.message == "Missing values in output: ['iota', 'kappa']"
+
     def test_explicit_values_override(self) -> None:
         """Test explicit values parameter overrides test case."""
         trace = Trace(input="test", output="specific content here")
@@ -70,6 +92,53 @@ class TestContainsGrader:
         assert result.status == GradeStatus.PASS
 
 
+class TestEqualsGrader:
+    """Tests for EqualsGrader."""
+
+    def test_whitespace_normalized_by_default(self) -> None:
+        """Test that outputs differing only in whitespace are equal."""
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        trace = Trace(input="t", output="  hello \n world ")
+
+        assert EqualsGrader(expected="hello world").grade(trace, test_case).passed
+        strict = EqualsGrader(expected="hello world", normalize_whitespace=False)
+        assert not strict.grade(trace, test_case).passed
+
+    def test_failure_reports_normalized_values(self) -> None:
+        """Test that a mismatch reports both sides after normalization."""
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        trace = Trace(input="t", output="hello   there")
+
+        result = EqualsGrader(expected="hello\tworld").grade(trace, test_case)
+
+        assert result.status == GradeStatus.FAIL
+        assert result.expected == "hello world"
+        assert result.actual == "hello there"
+
+
+class TestRegexGrader:
+    """Tests for RegexGrader."""
+
+    def test_pattern_from_expected(self) -> None:
+        """Test matching against the test case's output_matches pattern."""
+        test_case = EvalCase(
+            name="test",
+            turns=[Turn(user="test", expected=ExpectedBehavior(output_matches=r"order #\d+"))],
+        )
+        grader = RegexGrader()
+
+        assert grader.grade(Trace(input="t", output="order #42"), test_case).passed
+        assert not grader.grade(Trace(input="t", output="order #x"), test_case).passed
+
+    def test_invalid_pattern_is_error(self) -> None:
+        """Test that an invalid pattern gives an error result instead of raising."""
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+
+        result = RegexGrader(pattern="(unclosed").grade(Trace(input="t", output="x"), test_case)
+
+        assert result.status == GradeStatus.ERROR
+
+
 class TestToolCalledGrader:
     """Tests for ToolCalledGrader."""
 
@@ -160,6 +229,23 @@ class TestToolNotCalledGrader:
         assert result.status == GradeStatus.FAIL
 
 
+class TestToolOrderGrader:
+    """Tests for ToolOrderGrader."""
+
+    def test_expected_order_as_subsequence(self) -> None:
+        """Test that expected tools must appear in order, with others between allowed."""
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        trace = Trace(
+            input="test",
+            steps=[Step.tool_call(name, {}) for name in ["search", "read", "search", "book"]],
+        )
+
+        assert ToolOrderGrader(["search", "book"]).grade(trace, test_case).passed
+        assert ToolOrderGrader(["read", "search", "book"]).grade(trace, test_case).passed
+        assert not ToolOrderGrader(["book", "search"]).grade(trace, test_case).passed
+        assert not ToolOrderGrader(["search", "search", "search"]).grade(trace, test_case).passed
+
+
 class TestMaxStepsGrader:
     """Tests for MaxStepsGrader."""
 
@@ -196,6 +282,33 @@ class TestMaxStepsGrader:
         assert result.status == GradeStatus.FAIL
 
 
+def _always_pass(trace: Trace, test_case: EvalCase) -> GradeResult:
+    """Module-level grading function for CustomGrader imports."""
+    return GradeResult.passed_result("custom", "ok")
+
+
+class TestCustomGrader:
+    """Tests for CustomGrader."""
+
+    def test_imports_function_at_init(self) -> None:
+        """Test that a module+function grader is resolved when constructed."""
+        grader = CustomGrader(module=__name__, function="_always_pass")
+
+        assert grader._loaded_func is _always_pass
+        trace = Trace(input="test", output="x")
+        assert grader.grade(trace, EvalCase(name="test", turns=[Turn(user="test")])).passed
+
+    def test_import_error_reported_when_grading(self) -> None:
+        """Test that a bad import doesn't raise at init but yields an error result."""
+        grader = CustomGrader(module=__name__, function="missing")
+
+        trace = Trace(input="test", output="x")
+        result = grader.grade(trace, EvalCase(name="test", turns=[Turn(user="test")]))
+
+        assert result.status == GradeStatus.ERROR
+        assert "missing" in result.message
+
+
 class TestCompositeGrader:
     """Tests for CompositeGrader."""
 
@@ -246,3 +359,269 @@ class TestCompositeGrader:
         result = composite.grade(trace, test_case)
 
         assert result.status == GradeStatus.PASS
+
+    def test_stops_once_outcome_decided(self) -> None:
+        """Test that graders after a deciding failure are not run."""
+        trace = Trace(input="test", output="hello")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+
+        graders = [ContainsGrader(values=["missing"]), MaxStepsGrader(max_steps=5)]
+        result = CompositeGrader(graders, require_all=True).grade(trace, test_case)
+
+        assert result.status == GradeStatus.FAIL
+        assert result.message == "0/2 graders passed, 1 not run"
+        assert len(result.details["results"]) == 1
+
+    def test_async_cancels_undecided_graders(self) -> None:
+        """Test that slow graders are cancelled once another grader decides the outcome."""
+        from evaldeck.graders import BaseGrader
+
+        finished: list[str] = []
+
+        class SleepyGrader(BaseGrader):
+            name = "sleepy"
+
+            def grade(self, trace, test_case):
+                raise NotImplementedError
+
+            async def grade_async(self, trace, test_case):
+                await asyncio.sleep(10)
+                finished.append(self.name)
+                return GradeResult.passed_result(self.name, "passed")
+
+        trace = Trace(input="test", output="hello")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        composite = CompositeGrader([SleepyGrader(), ContainsGrader(values=["missing"])])
+
+        result = asyncio.run(asyncio.wait_for(composite.grade_async(trace, test_case), 1))
+
+        assert result.status == GradeStatus.FAIL
+        assert [r["grader_name"] for r in result.details["results"]] == ["contains"]
+        assert finished == []
+
+    async def test_async_cancelled_graders_settled_on_return(self) -> None:
+        """Test that cancelled sub-grader tasks have finished cancelling on return."""
+        from evaldeck.graders import BaseGrader
+
+        started: list[asyncio.Task] = []
+
+        class SleepyGrader(BaseGrader):
+            name = "sleepy"
+
+            def grade(self, trace, test_case):
+                raise NotImplementedError
+
+            async def grade_async(self, trace, test_case):
+                task = asyncio.current_task()
+                assert task is not None
+                started.append(task)
+                await asyncio.sleep(10)
+                return GradeResult.passed_result(self.name, "passed")
+
+        trace = Trace(input="test", output="hello")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        composite = CompositeGrader([SleepyGrader(), ContainsGrader(values=["missing"])])
+
+        result = await composite.grade_async(trace, test_case)
+
+        assert result.status == GradeStatus.FAIL
+        assert len(started) == 1
+        assert started[0].cancelled()
+
+
+class TestLLMGraderCache:
+    """Tests for LLMGrader response caching."""
+
+    def _grader(self, cache: MemoryLLMCache | SQLiteLLMCache, calls: list[str]) -> LLMGrader:
+        grader = LLMGrader(api_key="test", cache=cache)
+
+        def fake_call(prompt: str) -> str:
+            calls.append(prompt)
+            return "VERDICT: PASS\nREASON: looks good"
+
+        grader._call_openai = fake_call  # type: ignore[method-assign]
+        return grader
+
+    def test_identical_prompt_hits_cache(self) -> None:
+        """Test that the second grade of the same trace reuses the response."""
+        trace = Trace(input="test", output="hello")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        calls: list[str] = []
+        grader = self._grader(MemoryLLMCache(), calls)
+
+        first = grader.grade(trace, test_case)
+        second = grader.grade(trace, test_case)
+
+        assert len(calls) == 1
+        assert first.status == second.status == GradeStatus.PASS
+        assert first.details["cached"] is False
+        assert second.details["cached"] is True
+
+    def test_different_output_misses_cache(self) -> None:
+        """Test that a changed trace produces a fresh call."""
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        calls: list[str] = []
+        grader = self._grader(MemoryLLMCache(), calls)
+
+        grader.grade(Trace(input="test", output="hello"), test_case)
+        grader.grade(Trace(input="test", output="goodbye"), test_case)
+
+        assert len(calls) == 2
+
+    def test_max_tokens_is_part_of_key(self) -> None:
+        """Test that a different response cap does not reuse a cached response."""
+        trace = Trace(input="test", output="hello")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        cache = MemoryLLMCache()
+        calls: list[str] = []
+
+        self._grader(cache, calls).grade(trace, test_case)
+        capped = self._grader(cache, calls)
+        capped.max_tokens = 64
+        capped.grade(trace, test_case)
+
+        assert len(calls) == 2
+
+    def test_concurrent_identical_prompts_share_request(self) -> None:
+        """Test that identical prompts graded concurrently send one request."""
+        trace = Trace(input="test", output="hello")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        calls: list[str] = []
+        grader = LLMGrader(api_key="test", cache=MemoryLLMCache())
+
+        async def fake_call(prompt: str) -> str:
+            calls.append(prompt)
+            await asyncio.sleep(0.01)
+            return "VERDICT: PASS\nREASON: looks good"
+
+        grader._call_openai_async = fake_call  # type: ignore[method-assign]
+
+        async def grade_twice() -> list:
+            return list(
+                await asyncio.gather(
+                    grader.grade_async(trace, test_case),
+                    grader.grade_async(trace, test_case),
+                )
+            )
+
+        results = asyncio.run(grade_twice())
+
+        assert len(calls) == 1
+        assert [r.status for r in results] == [GradeStatus.PASS, GradeStatus.PASS]
+
+    def test_parse_response(self) -> None:
+        """Test verdict, reason and score parsing, including the fallbacks."""
+        grader = LLMGrader(api_key="test")
+
+        assert grader._parse_response("Verdict: pass\nREASON: fine\nSCORE: 8") == (
+            GradeStatus.PASS,
+            "fine\nSCORE: 8",
+            0.8,
+        )
+        assert grader._parse_response("This would PASS.")[0] == GradeStatus.PASS
+        assert grader._parse_response("this would pass")[0] == GradeStatus.PASS
+        assert grader._parse_response("Could PASS, but FAIL overall")[0] == GradeStatus.FAIL
+        assert grader._parse_response("No idea")[0] == GradeStatus.FAIL
+
+    def test_prompt_fills_only_used_placeholders(self) -> None:
+        """Test that trace and expected placeholders are filled when present."""
+        trace = Trace(input="test", output="hello", steps=[Step.tool_call("search", {})])
+        test_case = EvalCase(
+            name="test",
+            turns=[Turn(user="test", expected=ExpectedBehavior(tools_called=["search"]))],
+        )
+
+        full = LLMGrader(api_key="test", prompt="{trace}|{expected}")._format_prompt(
+            trace, test_case
+        )
+        assert "Tool: search" in full
+        assert "'tools_called': ['search']" in full
+
+        assert (
+            LLMGrader(api_key="test", prompt="{output}")._format_prompt(trace, test_case) == "hello"
+        )
+
+    async def test_grade_many_async_bounds_concurrency(self) -> None:
+        """Test that batch grading keeps order and caps requests in flight."""
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        traces = [Trace(input="test", output=f"answer {i}") for i in range(6)]
+        grader = LLMGrader(api_key="test", prompt="{output}")
+        active = 0
+        peak = 0
+
+        async def fake_call(prompt: str) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            verdict = "PASS" if prompt.endswith(("0", "2", "4")) else "FAIL"
+            return f"VERDICT: {verdict}\nREASON: {prompt}"
+
+        grader._call_openai_async = fake_call  # type: ignore[method-assign]
+
+        results = await grader.grade_many_async([(t, test_case) for t in traces], concurrency=2)
+
+        assert peak == 2
+        assert [r.message for r in results] == [f"answer {i}" for i in range(6)]
+        assert [r.passed for r in results] == [True, False] * 3
+
+    def test_sqlite_cache_persists(self, tmp_path: Path) -> None:
+        """Test that the SQLite cache is shared across instances."""
+        trace = Trace(input="test", output="hello")
+        test_case = EvalCase(name="test", turns=[Turn(user="test")])
+        calls: list[str] = []
+
+        self._grader(SQLiteLLMCache(tmp_path / "cache.db"), calls).grade(trace, test_case)
+        result = self._grader(SQLiteLLMCache(tmp_path / "cache.db"), calls).grade(trace, test_case)
+
+        assert len(calls) == 1
+        assert result.details["cached"] is True
+
+
+class FakeClient:
+    """Stand-in for an API client class."""
+
+    def __init__(self, api_key: str) -> None:
+        self.api_key = api_key
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestLLMClientReuse:
+    """Tests for sharing API clients between LLM grader calls."""
+
+    def test_sync_client_shared_per_key(self) -> None:
+        """Test that the same API key reuses one client."""
+        first = _shared_client(FakeClient, "key-a")
+
+        assert _shared_client(FakeClient, "key-a") is first
+        assert _shared_client(FakeClient, "key-b") is not first
+
+    def test_async_client_shared_per_loop(self) -> None:
+        """Test that async clients are reused within a loop but not across loops."""
+
+        async def get() -> tuple[FakeClient, FakeClient]:
+            return _shared_async_client(FakeClient, "key"), _shared_async_client(FakeClient, "key")
+
+        first, again = asyncio.run(get())
+        other_loop, _ = asyncio.run(get())
+
+        assert first is again
+        assert other_loop is not first
+
+    def test_async_clients_closed_for_loop(self) -> None:
+        """Test that aclose_async_clients closes and forgets the loop's clients."""
+
+        async def open_and_close() -> tuple[FakeClient, FakeClient]:
+            client = _shared_async_client(FakeClient, "key")
+            await aclose_async_clients()
+            return client, _shared_async_client(FakeClient, "key")
+
+        closed, fresh = asyncio.run(open_and_close())
+
+        assert closed.closed
+        assert fresh is not closed
+        assert not fresh.closed
@@ -0,0 +1,110 @@
+"""Tests for OpenTelemetry integration."""
+
+import threading
+from collections.abc import Iterator
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+
+from evaldeck.integrations import EvaldeckSpanProcessor, setup_otel_tracing
+
+_processor: EvaldeckSpanProcessor | None = None
+
+
+@pytest.fixture
+def processor() -> Iterator[EvaldeckSpanProcessor]:
+    """A processor registered with the global tracer provider (set once per process)."""
+    global _processor
+    if _processor is None:
+        _processor = setup_otel_tracing()
+    _processor.reset()
+    yield _processor
+    _processor.reset()
+
+
+def _run_chain(input_text: str, tool_name: str) -> None:
+    """Emit spans shaped like an OpenInference-instrumented agent run."""
+    tracer = trace.get_tracer(__name__)
+    with tracer.start_as_current_span(
+        "agent",
+        attributes={
+            "openinference.span.kind": "CHAIN",
+            "input.value": input_text,
+            "output.value": f"done: {input_text}",
+        },
+    ):
+        with tracer.start_as_current_span(
+            tool_name,
+            attributes={"openinference.span.kind": "TOOL", "tool.name": tool_name},
+        ):
+            pass
+
+
+class TestEvaldeckSpanProcessor:
+    """Tests for EvaldeckSpanProcessor."""
+
+    def test_root_chain_becomes_trace(self, processor: EvaldeckSpanProcessor) -> None:
+        """Test that a parentless CHAIN span populates the trace."""
+        _run_chain("hello", "search")
+
+        captured = processor.get_latest_trace()
+        assert captured is not None
+        assert captured.input == "hello"
+        assert captured.output == "done: hello"
+        assert captured.tools_called == ["search"]
+
+    def test_invocation_scopes_trace(self, processor: EvaldeckSpanProcessor) -> None:
+        """Test that the chain under an invocation span is treated as root."""
+        with processor.invocation() as trace_id:
+            _run_chain("hello", "search")
+
+        captured = processor.get_trace(trace_id)
+        assert captured is not None
+        assert captured.input == "hello"
+        assert captured.tools_called == ["search"]
+
+    def test_concurrent_invocations_do_not_mix(self, processor: EvaldeckSpanProcessor) -> None:
+        """Test that invocations running in parallel threads get separate traces."""
+        trace_ids: dict[int, str] = {}
+        barrier = threading.Barrier(4)
+
+        def worker(i: int) -> None:
+            with processor.invocation() as trace_id:
+                barrier.wait()
+                _run_chain(f"input-{i}", f"tool_{i}")
+            trace_ids[i] = trace_id
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i, trace_id in trace_ids.items():
+            captured = processor.get_trace(trace_id)
+            assert captured is not None
+            assert captured.input == f"input-{i}"
+            assert captured.tools_called == [f"tool_{i}"]
+
+    def test_max_traces_evicts_oldest(self) -> None:
+        """Test that the processor keeps only the most recent max_traces traces."""
+        bounded = EvaldeckSpanProcessor(max_traces=2)
+        provider = TracerProvider()
+        provider.add_span_processor(bounded)
+        tracer = provider.get_tracer(__name__)
+
+        for i in range(3):
+            attributes = {"openinference.span.kind": "CHAIN", "input.value": f"input-{i}"}
+            with tracer.start_as_current_span("agent", attributes=attributes):
+                pass
+
+        assert [t.input for t in bounded.get_all_traces()] == ["input-1", "input-2"]
+        latest = bounded.get_latest_trace()
+        assert latest is not None
+        assert latest.input == "input-2"
+
+    def test_max_traces_must_be_positive(self) -> None:
+        """Test that a non-positive retention limit is rejected."""
+        with pytest.raises(ValueError):
+            EvaldeckSpanProcessor(max_traces=0)
@@ -0,0 +1,31 @@
+"""Tests for results module."""
+
+from evaldeck import EvaluationResult, GradeResult, GradeStatus, SuiteResult
+
+
+class TestSuiteResult:
+    """Tests for SuiteResult."""
+
+    def test_counts_track_added_results(self) -> None:
+        """Test that status counts stay correct as results are added."""
+        suite = SuiteResult(suite_name="suite")
+        suite.add_result(EvaluationResult(test_case_name="a", status=GradeStatus.PASS))
+        suite.add_result(EvaluationResult(test_case_name="b", status=GradeStatus.FAIL))
+        assert (suite.passed, suite.failed, suite.errors) == (1, 1, 0)
+
+        suite.add_result(EvaluationResult(test_case_name="c", status=GradeStatus.ERROR))
+        assert (suite.passed, suite.failed, suite.errors) == (1, 1, 1)
+        assert suite.pass_rate == 1 / 3
+
+    def test_counts_track_changes_to_existing_results(self) -> None:
+        """Test that counts follow results changed after being added to the suite."""
+        suite = SuiteResult(suite_name="suite")
+        result = EvaluationResult(test_case_name="a", status=GradeStatus.PASS)
+        suite.add_result(result)
+        assert (suite.passed, suite.failed) == (1, 0)
+
+        result.add_grade(GradeResult.failed_result("contains", "missing"))
+        assert (suite.passed, suite.failed) == (0, 1)
+
+        suite.results[0] = EvaluationResult(test_case_name="a", status=GradeStatus.ERROR)
+        assert (suite.passed, suite.failed, suite.errors) == (0, 0, 1)
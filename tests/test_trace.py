@@ -1,6 +1,8 @@
 """Tests for trace module."""
 
-from evaldeck import Step, StepType, Trace, TraceStatus
+from datetime import datetime, timedelta
+
+from evaldeck import Step, StepType, TokenUsage, Trace, TraceStatus
 
 
 class TestStep:
@@ -75,6 +77,7 @@ class TestTrace:
         trace.add_step(Step.tool_call("search", {}))  # Duplicate
 
         assert trace.tools_called == ["search", "book", "search"]
+        assert trace.tools_called_set == frozenset({"search", "book"})
 
     def test_tool_calls_property(self) -> None:
         """Test filtering tool call steps."""
@@ -87,6 +90,48 @@ class TestTrace:
         assert len(tool_calls) == 2
         assert all(s.type == StepType.TOOL_CALL for s in tool_calls)
 
+    def test_step_views_track_new_steps(self) -> None:
+        """Test that cached step views update when steps are added or replaced."""
+        trace = Trace(input="Test")
+        trace.add_step(Step.tool_call("search", {}))
+        assert trace.tools_called == ["search"]
+
+        trace.add_step(Step.tool_call("book", {}))
+        trace.steps.append(Step.llm_call("gpt-4", "input", "output"))
+        assert trace.tools_called == ["search", "book"]
+        assert len(trace.llm_calls) == 1
+        assert (trace.tool_call_count, trace.llm_call_count) == (2, 1)
+
+        trace.steps = [Step.tool_call("cancel", {})]
+        assert trace.tools_called == ["cancel"]
+        assert trace.llm_calls == []
+        assert (trace.tool_call_count, trace.llm_call_count) == (1, 0)
+
+    def test_add_step_refreshes_step_views(self) -> None:
+        """Test that add_step picks up earlier in-place edits to existing steps."""
+        trace = Trace(input="Test")
+        trace.add_step(
+            Step.llm_call("gpt-4", "input", "output", tokens=TokenUsage(total_tokens=10))
+        )
+        assert trace.total_tokens == 10
+
+        trace.steps[0].tokens = TokenUsage(total_tokens=50)
+        trace.add_step(Step.tool_call("search", {}))
+        assert trace.total_tokens == 50
+        assert trace.tools_called == ["search"]
+
+    def test_output_casefolded_tracks_output(self) -> None:
+        """Test that the casefolded output is reused and follows output changes."""
+        trace = Trace(input="Test")
+        assert trace.output_casefolded == ""
+
+        trace.complete("Straße OK")
+        assert trace.output_casefolded == "strasse ok"
+        assert trace.output_casefolded is trace.output_casefolded
+
+        trace.output = "Done"
+        assert trace.output_casefolded == "done"
+
     def test_complete(self) -> None:
         """Test completing a trace."""
         trace = Trace(input="Test")
@@ -96,6 +141,26 @@ class TestTrace:
         assert trace.status == TraceStatus.SUCCESS
         assert trace.completed_at is not None
 
+    def test_complete_duration(self) -> None:
+        """Test that duration is measured for new traces and derived for loaded ones."""
+        trace = Trace(input="Test")
+        trace.complete("Done!")
+        assert trace.duration_ms is not None
+        assert trace.duration_ms >= 0
+
+        loaded = Trace(input="Test", started_at=datetime(2024, 1, 1, 12, 0, 0))
+        loaded.complete("Done!")
+        assert loaded.duration_ms is not None
+        assert loaded.duration_ms > 1000
+
+    def test_complete_duration_after_started_at_reassigned(self) -> None:
+        """Test that a reassigned started_at is used instead of the construction time."""
+        trace = Trace(input="Test")
+        trace.started_at = datetime.now() - timedelta(seconds=5)
+        trace.complete("Done!")
+        assert trace.duration_ms is not None
+        assert trace.duration_ms >= 5000
+
     def test_serialization(self) -> None:
         """Test trace serialization round-trip."""
         trace = Trace(input="Test", output="Result")